@@ -12,7 +12,9 @@ Scoring Factors (0-100 total):
 
 import math
 import re
-from typing import Dict, Optional
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 
 
 class DomainScorer:
@@ -23,7 +25,7 @@ class DomainScorer:
         "tech": 3, "ai": 4, "app": 2, "cloud": 3, "data": 2, "web": 2, "digital": 2,
         "invest": 3, "finance": 3, "money": 2, "crypto": 3, "nft": 2, "forex": 2,
         "trade": 2, "shop": 2, "store": 2, "market": 2, "sale": 1, "buy": 1,
-        "pro": 1, "hub": 1, "labs": 1, "io": 2, "ai": 4, "labs": 1,
+        "pro": 1, "hub": 1, "labs": 1, "io": 2,
         "studio": 1, "group": 1, "systems": 1, "solutions": 1, "platform": 2,
         "services": 1, "works": 1, "tools": 1, "gear": 1, "smart": 2,
     }
@@ -31,25 +33,54 @@ class DomainScorer:
     # Common low-value keywords that decrease score
     LOW_VALUE_KEYWORDS = {
         "test": -5, "demo": -5, "xxx": -10, "porn": -10, "adult": -10,
-        "spam": -10, "click": -2, "spam": -10, "tmp": -10, "temp": -10,
+        "spam": -10, "click": -2, "tmp": -10, "temp": -10,
     }
 
-    # TLD values
+    # All keyword values in one table, matched in a single regex pass. The
+    # lookahead lets overlapping keywords match (e.g. "ai" inside "aitools");
+    # longer keywords are tried first at each position.
+    KEYWORD_VALUES = {**HIGH_VALUE_KEYWORDS, **LOW_VALUE_KEYWORDS}
+    _KEYWORD_RE = re.compile(
+        "(?=(" + "|".join(map(re.escape, sorted(KEYWORD_VALUES, key=len, reverse=True))) + "))"
+    )
+
+    # Brandability features in one scan: a run of three identical
+    # characters, a hyphen, a digit, or a vowel. Runs are tried first so a
+    # repeated vowel/digit/hyphen is still counted via its "ch" group.
+    _BRAND_RE = re.compile(r"(?P<rep>(?P<ch>.)(?P=ch)(?P=ch))|(?P<hy>-)|(?P<dg>\d)|(?P<vw>[aeiou])")
+
+    # Length bonus indexed by min(len(name), 13); sweet spot is 6-12 chars
+    _LENGTH_BONUS = (0, 0, 0, 0, 3, 3, 5, 5, 5, 5, 5, 5, 5, 1)
+
+    # Quality-score bands shared by estimate_price and get_grade:
+    # bisect_right(GRADE_THRESHOLDS, score) indexes the tables below
+    GRADE_THRESHOLDS = (25, 40, 55, 70, 85)
+    GRADES = ("F", "E", "D", "C", "B", "A")
+    PRICE_RANGES = (
+        (5, 25),
+        (20, 150),
+        (100, 600),
+        (500, 3000),
+        (2000, 15000),
+        (10000, 100000),
+    )
+
+    # TLD values, keyed by lowercase TLD without the leading dot
     TLD_VALUES = {
-        ".com": 25,
-        ".io": 20,
-        ".ai": 18,
-        ".co": 15,
-        ".net": 10,
-        ".org": 10,
-        ".dev": 15,
-        ".app": 12,
-        ".tech": 12,
-        ".online": 5,
-        ".site": 5,
-        ".website": 5,
-        ".info": 3,
-        ".biz": 3,
+        "com": 25,
+        "io": 20,
+        "ai": 18,
+        "co": 15,
+        "net": 10,
+        "org": 10,
+        "dev": 15,
+        "app": 12,
+        "tech": 12,
+        "online": 5,
+        "site": 5,
+        "website": 5,
+        "info": 3,
+        "biz": 3,
     }
 
     @staticmethod
@@ -58,14 +89,7 @@ class DomainScorer:
         Score based on domain age
         Max 20 points at 10+ years
         """
-        if age_days is None or age_days <= 0:
-            return 0
-
-        years = age_days / 365.25
-        # Logarithmic scale: more points for older domains
-        # 1 year = 5 pts, 5 years = 15 pts, 10 years = 20 pts
-        score = min(20, math.log10(years + 1) * 7.5)
-        return max(0, score)
+        return DomainScorer.score_numeric(age_days, None, None)[0]
 
     @staticmethod
     def score_backlinks(backlink_count: int) -> float:
@@ -73,13 +97,7 @@ class DomainScorer:
         Score based on backlink count
         Max 25 points for 100+ backlinks
         """
-        if backlink_count is None or backlink_count <= 0:
-            return 0
-
-        # Logarithmic scale for backlinks
-        # 1 link = 2 pts, 10 links = 8 pts, 100 links = 16 pts, 1000 links = 25 pts
-        score = min(25, math.log10(backlink_count + 1) * 8)
-        return max(0, score)
+        return DomainScorer.score_numeric(None, backlink_count, None)[1]
 
     @staticmethod
     def score_domain_authority(authority: Optional[int]) -> float:
@@ -87,75 +105,99 @@ class DomainScorer:
         Score based on domain authority
         Max 20 points at DA 50+
         """
-        if authority is None or authority <= 0:
-            return 0
-
-        # Linear scale: DA 10 = 2 pts, DA 30 = 12 pts, DA 50+ = 20 pts
-        score = min(20, authority * 0.4)
-        return max(0, score)
+        return DomainScorer.score_numeric(None, None, authority)[2]
 
     @staticmethod
     def score_tld(tld: str) -> float:
         """Score based on TLD value"""
-        return DomainScorer.TLD_VALUES.get(f".{tld.lower()}", 0)
+        # Scraped TLDs are already lowercase and dotless: one dict hit
+        value = DomainScorer.TLD_VALUES.get(tld)
+        if value is None:
+            value = DomainScorer.TLD_VALUES.get(tld.lower().lstrip("."), 0)
+        return value
 
     @staticmethod
-    def score_brandability(domain_name: str) -> float:
+    def score_brandability(domain_name: str, *, _lower: Optional[str] = None) -> float:
         """
         Score brandability (0-15 points)
         Factors: length, pronounceability, no hyphens/numbers
+
+        _lower: domain_name already lowercased by the caller, if available
         """
-        score = 0
-        name = domain_name.lower()
+        name = _lower if _lower is not None else domain_name.lower()
+
+        has_hyphen = has_digit = False
+        vowels = 0
+        repeated = set()
+        for match in DomainScorer._BRAND_RE.finditer(name):
+            kind = match.lastgroup
+            if kind == "vw":
+                vowels += 1
+            elif kind == "rep":
+                char = match.group("ch")
+                repeated.add(char)
+                if char in "aeiou":
+                    vowels += 3
+                elif char == "-":
+                    has_hyphen = True
+                elif char.isdigit():
+                    has_digit = True
+            elif kind == "dg":
+                has_digit = True
+            else:
+                has_hyphen = True
 
         # Length bonus (sweet spot: 6-12 chars)
-        if 6 <= len(name) <= 12:
-            score += 5
-        elif 4 <= len(name) < 6:
-            score += 3
-        elif len(name) > 12:
-            score += 1
+        score = DomainScorer._LENGTH_BONUS[min(len(name), 13)]
 
         # Penalty for hyphens/numbers (harder to remember)
-        if '-' in name:
+        if has_hyphen:
             score -= 3
-        if any(c.isdigit() for c in name):
+        if has_digit:
             score -= 2
 
         # Bonus for vowels (more pronounceable)
-        vowels = sum(1 for c in name if c in 'aeiou')
         vowel_ratio = vowels / len(name) if name else 0
         if 0.3 <= vowel_ratio <= 0.5:
             score += 3
 
-        # Penalty for excessive repetition (aaaa, bbbb)
-        for char in set(name):
-            if name.count(char * 3) > 0:
-                score -= 2
+        # Penalty for excessive repetition (aaaa, bbbb), once per character
+        score -= 2 * len(repeated)
 
         return max(0, min(15, score))
 
     @staticmethod
-    def score_keywords(domain_name: str) -> float:
+    def score_keywords(domain_name: str, *, _lower: Optional[str] = None) -> float:
         """
         Score keyword value (0-15 points)
         Check for high-value keywords
-        """
-        name = domain_name.lower()
-        score = 0
 
-        # Check high-value keywords
-        for keyword, value in DomainScorer.HIGH_VALUE_KEYWORDS.items():
-            if keyword in name:
-                score += value
+        _lower: domain_name already lowercased by the caller, if available
+        """
+        name = _lower if _lower is not None else domain_name.lower()
 
-        # Check low-value keywords (penalties)
-        for keyword, penalty in DomainScorer.LOW_VALUE_KEYWORDS.items():
-            if keyword in name:
-                score += penalty
+        # Each keyword counts once, however often it appears; low-value
+        # keywords carry negative values (penalties)
+        values = DomainScorer.KEYWORD_VALUES
+        score = sum(values[kw] for kw in set(DomainScorer._KEYWORD_RE.findall(name)))
 
         return max(0, min(15, score))
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def score_name(name_lower: str) -> Tuple[float, float]:
+        """
+        Brandability and keyword scores of a lowercased domain name
+
+        The two regex scans are the costliest part of scoring and depend on
+        the name alone, so they are memoized: daily scrapes keep returning
+        many of the same names. See score_name.cache_info() for hit rates.
+        """
+        return (
+            DomainScorer.score_brandability(name_lower, _lower=name_lower),
+            DomainScorer.score_keywords(name_lower, _lower=name_lower),
+        )
+
     @staticmethod
     def score_traffic(traffic_json: Optional[Dict]) -> float:
         """
@@ -214,14 +256,27 @@ class DomainScorer:
             }
         """
 
-        age_score = cls.score_domain_age(age_days)
-        backlink_score = cls.score_backlinks(backlink_count)
-        authority_score = cls.score_domain_authority(domain_authority)
-        brandability_score = cls.score_brandability(domain_name)
-        keyword_score = cls.score_keywords(domain_name)
-        traffic_score = cls.score_traffic(traffic_json)
-        tld_score = cls.score_tld(tld)
+        brandability_score, keyword_score = cls.score_name(domain_name.lower())
 
+        return cls._build_breakdown(
+            *cls.score_numeric(age_days, backlink_count, domain_authority),
+            cls.score_tld(tld),
+            brandability_score,
+            keyword_score,
+            cls.score_traffic(traffic_json),
+        )
+
+    @staticmethod
+    def _build_breakdown(
+        age_score: float,
+        backlink_score: float,
+        authority_score: float,
+        tld_score: float,
+        brandability_score: float,
+        keyword_score: float,
+        traffic_score: float,
+    ) -> Dict:
+        """Round sub-scores and add the capped total (TLD is reported, not summed)"""
         # Total score (cap at 100)
         total_score = min(
             100,
@@ -240,6 +295,67 @@ class DomainScorer:
             "total_score": round(total_score, 2),
         }
 
+    @staticmethod
+    def score_numeric(
+        age_days: Optional[int], backlink_count: Optional[int], authority: Optional[int]
+    ) -> Tuple[float, float, float]:
+        """
+        Age, backlink and authority scores in one call
+
+        The one definition of these formulas, in a single frame for the
+        calculate_score path; score_domain_age, score_backlinks,
+        score_domain_authority and score_numeric_batch all delegate here
+        """
+        log10 = math.log10
+        return (
+            # Logarithmic scale: more points for older domains
+            # 1 year = 5 pts, 5 years = 15 pts, 10 years = 20 pts
+            min(20, log10(age_days / 365.25 + 1) * 7.5) if age_days is not None and age_days > 0 else 0,
+            # Logarithmic scale for backlinks
+            # 1 link = 2 pts, 10 links = 8 pts, 100 links = 16 pts, 1000 links = 25 pts
+            min(25, log10(backlink_count + 1) * 8) if backlink_count is not None and backlink_count > 0 else 0,
+            # Linear scale: DA 10 = 2 pts, DA 30 = 12 pts, DA 50+ = 20 pts
+            min(20, authority * 0.4) if authority is not None and authority > 0 else 0,
+        )
+
+    # ===== Batch scoring =====
+
+    @staticmethod
+    def score_numeric_batch(domains: Iterable[Dict]) -> List[Tuple[float, float, float]]:
+        """
+        score_numeric for each domain, reading each domain's fields once
+        """
+        score_numeric = DomainScorer.score_numeric
+        return [
+            score_numeric(d.get("age_days", 0), d.get("backlink_count", 0), d.get("domain_authority"))
+            for d in domains
+        ]
+
+    @classmethod
+    def calculate_score_batch(cls, domains: List[Dict]) -> List[Dict]:
+        """
+        Score many domains at once, column by column
+
+        Each item holds calculate_score() keyword arguments (domain_name,
+        tld, age_days, backlink_count, domain_authority, traffic_json).
+        Returns one breakdown dict per item, in input order.
+        """
+        numeric_scores = cls.score_numeric_batch(domains)
+        tld_scores = [cls.score_tld(d["tld"]) for d in domains]
+        score_name = cls.score_name
+        name_scores = [score_name(d["domain_name"].lower()) for d in domains]
+        brandability_scores = [brandability for brandability, _ in name_scores]
+        keyword_scores = [keyword for _, keyword in name_scores]
+        traffic_scores = [cls.score_traffic(d.get("traffic_json")) for d in domains]
+
+        build = cls._build_breakdown
+        return [
+            build(age, backlinks, authority, tld, brandability, keyword, traffic)
+            for (age, backlinks, authority), tld, brandability, keyword, traffic in zip(
+                numeric_scores, tld_scores, brandability_scores, keyword_scores, traffic_scores,
+            )
+        ]
+
     @staticmethod
     def estimate_price(quality_score: float) -> tuple:
         """
@@ -253,18 +369,7 @@ class DomainScorer:
         - E (25-39): $20 - $150
         - F (0-24): $5 - $25
         """
-        if quality_score >= 85:
-            return (10000, 100000)
-        elif quality_score >= 70:
-            return (2000, 15000)
-        elif quality_score >= 55:
-            return (500, 3000)
-        elif quality_score >= 40:
-            return (100, 600)
-        elif quality_score >= 25:
-            return (20, 150)
-        else:
-            return (5, 25)
+        return DomainScorer.PRICE_RANGES[bisect_right(DomainScorer.GRADE_THRESHOLDS, quality_score)]
 
     @staticmethod
     def estimate_roi(quality_score: float, purchase_price: float = 50) -> float:
@@ -280,15 +385,20 @@ class DomainScorer:
     @staticmethod
     def get_grade(quality_score: float) -> str:
         """Get letter grade based on quality score"""
-        if quality_score >= 85:
-            return "A"
-        elif quality_score >= 70:
-            return "B"
-        elif quality_score >= 55:
-            return "C"
-        elif quality_score >= 40:
-            return "D"
-        elif quality_score >= 25:
-            return "E"
-        else:
-            return "F"
+        return DomainScorer.GRADES[bisect_right(DomainScorer.GRADE_THRESHOLDS, quality_score)]
+
+    @staticmethod
+    def valuate(quality_score: float, purchase_price: float = 50) -> Tuple[str, int, int, float]:
+        """
+        Grade, price range and ROI for a quality score from one band lookup
+
+        Same results as get_grade, estimate_price and estimate_roi, for
+        callers that report all of them.
+
+        Returns:
+            (grade, price_low, price_high, roi_percent)
+        """
+        band = bisect_right(DomainScorer.GRADE_THRESHOLDS, quality_score)
+        price_low, price_high = DomainScorer.PRICE_RANGES[band]
+        roi_percent = round(((price_high - purchase_price) / purchase_price) * 100, 1)
+        return DomainScorer.GRADES[band], price_low, price_high, roi_percent
@@ -1,36 +1,157 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from typing import AsyncIterator
 from config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Async drivers by database backend; whichever sync driver DATABASE_URL
+# names (postgresql, postgresql+psycopg2, sqlite+pysqlite, ...) is swapped
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+def _async_url(url: str) -> URL:
+    """Translate the sync DATABASE_URL into its async-driver equivalent"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    driver = ASYNC_DRIVERS.get(backend)
+    if driver is None:
+        return parsed
+    return parsed.set(drivername=f"{backend}+{driver}")
+
 # Database connection
+# Connections are recycled every DB_POOL_RECYCLE seconds (30 minutes by
+# default) instead of pinged with a "SELECT 1" on every checkout; set
+# DB_POOL_PRE_PING=true where idle connections are cut sooner. SQLite has no
+# server-side idle timeout, so its connections stay open for the life of
+# the process and keep their warm page cache between requests
+IS_SQLITE = make_url(settings.DATABASE_URL).get_backend_name() == "sqlite"
+POOL_RECYCLE = -1 if IS_SQLITE else settings.DB_POOL_RECYCLE
+
+# The sync pool serves streaming exports, which hold a connection for the
+# whole response, so it is sized larger
 engine = create_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
-    pool_size=10,
-    max_overflow=20,
-    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_recycle=POOL_RECYCLE,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+)
+
+async_engine = create_async_engine(
+    _async_url(settings.DATABASE_URL),
+    echo=settings.DEBUG,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DB_ASYNC_POOL_SIZE,
+    max_overflow=settings.DB_ASYNC_MAX_OVERFLOW,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_recycle=POOL_RECYCLE,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# SQLite tuning: WAL lets readers run alongside the writer, and NORMAL
+# sync skips the fsync on every commit (safe under WAL)
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+for _engine in (engine, async_engine.sync_engine):
+    if _engine.dialect.name == "sqlite":
+        event.listen(_engine, "connect", _set_sqlite_pragmas)
+
+session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
-def get_db() -> Session:
-    """Dependency for FastAPI to get database session"""
-    db = SessionLocal()
-    try:
+class SessionManager:
+    """
+    Explicitly owned sync session for work that outlives a request handler
+
+    Streaming exports hand the manager to their response generator, which
+    closes it once the last row is sent (or the client goes away), so the
+    session lives exactly as long as the stream instead of the request.
+
+        with SessionManager() as db:
+            ...
+    """
+
+    def __init__(self):
+        self.session = session_factory()
+
+    def __enter__(self) -> Session:
+        return self.session
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            self.session.rollback()
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """Dependency for async FastAPI endpoints to get a non-blocking database session"""
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+def upsert_insert(dialect_name: str):
+    """Dialect-specific insert() construct that supports ON CONFLICT clauses"""
+    return sqlite.insert if dialect_name == "sqlite" else postgresql.insert
+
+# Advisory lock key held by the worker that initializes the schema
+SCHEMA_LOCK_ID = 42
 
 def init_db():
-    """Initialize database tables"""
+    """
+    Initialize database tables
+
+    Every worker calls this on startup. On Postgres workers take the
+    advisory lock in turn, so the first one creates the schema while the
+    others wait for it, then find every table in place and issue no DDL.
+    """
     try:
-        Base.metadata.create_all(bind=engine)
-        logger.info("Database tables created successfully")
+        with engine.connect() as conn:
+            is_postgres = engine.dialect.name == "postgresql"
+            if is_postgres:
+                conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": SCHEMA_LOCK_ID})
+
+            try:
+                existing = set(inspect(conn).get_table_names())
+                if existing.issuperset(Base.metadata.tables):
+                    logger.info("Database tables already exist")
+                    return
+
+                Base.metadata.create_all(bind=conn)
+                conn.commit()
+                logger.info("Database tables created successfully")
+            except Exception:
+                # A failed DDL statement aborts the transaction; roll it back
+                # so the unlock below can run and the original error surfaces
+                conn.rollback()
+                raise
+            finally:
+                if is_postgres:
+                    conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": SCHEMA_LOCK_ID})
     except Exception as e:
         logger.error(f"Error creating database tables: {e}")
         raise
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, JSON, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, JSON, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
@@ -38,6 +38,12 @@ class Domain(Base):
 
     __table_args__ = (
         UniqueConstraint('domain_name', 'tld', name='uq_domain_tld'),
+        # Sort keys of the listing endpoints, with id as the keyset tiebreaker
+        Index('ix_domain_quality_desc', quality_score.desc(), id.desc()),
+        Index('ix_domain_age', domain_age_days, id),
+        Index('ix_domain_backlinks', backlink_count, id),
+        # Alert and top-opportunity queries only look at decent scores
+        Index('ix_domain_hq', quality_score, postgresql_where=(quality_score >= 40)),
     )
 
 class PortfolioItem(Base):
@@ -106,3 +112,8 @@ class DomainScore(Base):
 
     # Metadata
     calculated_at = Column(DateTime, default=func.now())
+
+    __table_args__ = (
+        # Latest-score lookups per domain
+        Index('ix_domain_scores_domain_calc', domain_id, calculated_at.desc()),
+    )
@@ -9,22 +9,44 @@ POST /api/domains              - Manually add domain
 
 import logging
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 from typing import Optional
 
-from database import get_db
-from schemas import DomainResponse, DomainDetailResponse, PaginatedResponse
+from analyzers.domain_scorer import DomainScorer
+from database import get_async_db, upsert_insert
+from schemas import BUY_LINK_PREFIXES, DomainResponse, DomainDetailResponse, PaginatedResponse
+from services.response_cache import etag_response, response_cache
 import models
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/domains", tags=["domains"])
 
+# Columns emitted by the list views; selecting them directly returns
+# lightweight rows instead of full ORM instances
+LIST_COLUMNS = (
+    models.Domain.id,
+    models.Domain.domain_name,
+    models.Domain.tld,
+    models.Domain.quality_score,
+    models.Domain.backlink_count,
+    models.Domain.domain_authority,
+    models.Domain.domain_age_days,
+    models.Domain.price_estimate_low,
+    models.Domain.price_estimate_high,
+    models.Domain.roi_estimate,
+    models.Domain.registered,
+    models.Domain.available,
+)
+
 
 @router.get("/top-opportunities", response_model=dict)
-def get_top_opportunities(
+@etag_response(cache_prefix="top")
+async def get_top_opportunities(
     limit: int = Query(20, ge=1, le=100),
     min_score: float = Query(0, ge=0, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get top domain opportunities sorted by quality score
@@ -36,11 +58,13 @@ def get_top_opportunities(
     Returns list of highest-scoring domains
     """
     try:
-        domains = db.query(models.Domain).filter(
-            models.Domain.quality_score >= min_score
-        ).order_by(
-            models.Domain.quality_score.desc()
-        ).limit(limit).all()
+        domains = (await db.execute(
+            select(*LIST_COLUMNS, models.Domain.last_checked).where(
+                models.Domain.quality_score >= min_score
+            ).order_by(
+                models.Domain.quality_score.desc()
+            ).limit(limit)
+        )).all()
 
         return {
             "success": True,
@@ -49,23 +73,26 @@ def get_top_opportunities(
             "min_score": min_score,
             "domains": [
                 {
-                    "id": d.id,
-                    "domain": f"{d.domain_name}.{d.tld}",
-                    "quality_score": d.quality_score,
-                    "grade": _get_grade(d.quality_score),
-                    "backlinks": d.backlink_count,
-                    "authority": d.domain_authority,
-                    "age_years": d.domain_age_days / 365.25,
+                    "id": id_,
+                    "domain": f"{name}.{tld}",
+                    "quality_score": score,
+                    "grade": DomainScorer.get_grade(score),
+                    "backlinks": backlinks,
+                    "authority": authority,
+                    "age_years": age / 365.25,
                     "estimated_value": {
-                        "low": d.price_estimate_low,
-                        "high": d.price_estimate_high,
+                        "low": low,
+                        "high": high,
                     },
-                    "roi_estimate": d.roi_estimate,
-                    "registered": d.registered,
-                    "available": d.available,
-                    "last_checked": d.last_checked.isoformat() if d.last_checked else None,
+                    "roi_estimate": roi,
+                    "registered": registered,
+                    "available": available,
+                    "last_checked": last_checked,
                 }
-                for d in domains
+                # Rows are flat tuples in LIST_COLUMNS order; unpacking them
+                # avoids a by-name lookup per field
+                for (id_, name, tld, score, backlinks, authority, age,
+                     low, high, roi, registered, available, last_checked) in domains
             ]
         }
 
@@ -78,24 +105,30 @@ def get_top_opportunities(
 
 
 @router.get("", response_model=dict)
-def list_domains(
+@etag_response(cache_prefix="list")
+async def list_domains(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     sort_by: str = Query("quality_score", regex="^(quality_score|domain_age_days|backlink_count)$"),
     order: str = Query("desc", regex="^(asc|desc)$"),
-    db: Session = Depends(get_db),
+    after_value: Optional[float] = None,
+    after_id: Optional[int] = None,
+    exact: bool = False,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     List all domains with pagination
 
     Query Parameters:
-    - skip: Number of results to skip (pagination)
+    - skip: Number of results to skip (offset pagination)
     - limit: Number of results per page (1-100)
     - sort_by: Field to sort by (quality_score, domain_age_days, backlink_count)
     - order: Sort order (asc, desc)
+    - after_value, after_id: Keyset cursor from a previous page's next_cursor
+    - exact: Return an exact total instead of the planner's row estimate
     """
     try:
-        query = db.query(models.Domain)
+        query = select(*LIST_COLUMNS, models.Domain.created_at)
 
         # Apply sorting
         if sort_by == "quality_score":
@@ -105,16 +138,40 @@ def list_domains(
         else:
             sort_field = models.Domain.backlink_count
 
+        # Order by (sort field, id) so the keyset cursor is unambiguous
         if order == "desc":
-            query = query.order_by(sort_field.desc())
+            query = query.order_by(sort_field.desc(), models.Domain.id.desc())
         else:
-            query = query.order_by(sort_field.asc())
+            query = query.order_by(sort_field.asc(), models.Domain.id.asc())
+
+        keyset = after_value is not None and after_id is not None
+        if keyset:
+            cursor = tuple_(sort_field, models.Domain.id)
+            if order == "desc":
+                query = query.where(cursor < tuple_(after_value, after_id))
+            else:
+                query = query.where(cursor > tuple_(after_value, after_id))
+
+        # An exact total rides along on each row as a window count, saving
+        # the separate COUNT(*) round-trip (not for keyset pages, where the
+        # window only sees the rows after the cursor)
+        windowed = not keyset and (exact or db.bind.dialect.name != "postgresql")
+        if windowed:
+            query = query.add_columns(func.count().over().label("total"))
+
+        # Apply pagination
+        domains = (await db.execute(query.offset(skip).limit(limit))).all()
 
         # Get total count
-        total = query.count()
+        if windowed and domains:
+            total = domains[0].total
+        else:
+            total = await _count_domains(db, exact)
 
-        # Apply pagination
-        domains = query.offset(skip).limit(limit).all()
+        next_cursor = None
+        if len(domains) == limit:
+            last = domains[-1]
+            next_cursor = {"after_value": getattr(last, sort_by), "after_id": last.id}
 
         return {
             "success": True,
@@ -122,25 +179,29 @@ def list_domains(
             "skip": skip,
             "limit": limit,
             "count": len(domains),
+            "next_cursor": next_cursor,
             "domains": [
                 {
-                    "id": d.id,
-                    "domain": f"{d.domain_name}.{d.tld}",
-                    "quality_score": d.quality_score,
-                    "grade": _get_grade(d.quality_score),
-                    "backlinks": d.backlink_count,
-                    "authority": d.domain_authority,
-                    "age_days": d.domain_age_days,
+                    "id": id_,
+                    "domain": f"{name}.{tld}",
+                    "quality_score": score,
+                    "grade": DomainScorer.get_grade(score),
+                    "backlinks": backlinks,
+                    "authority": authority,
+                    "age_days": age,
                     "estimated_value": {
-                        "low": d.price_estimate_low,
-                        "high": d.price_estimate_high,
+                        "low": low,
+                        "high": high,
                     },
-                    "roi_estimate": d.roi_estimate,
-                    "registered": d.registered,
-                    "available": d.available,
-                    "created_at": d.created_at.isoformat() if d.created_at else None,
+                    "roi_estimate": roi,
+                    "registered": registered,
+                    "available": available,
+                    "created_at": created_at,
                 }
-                for d in domains
+                # Rows are flat tuples in LIST_COLUMNS order; unpacking them
+                # avoids a by-name lookup per field
+                for (id_, name, tld, score, backlinks, authority, age,
+                     low, high, roi, registered, available, created_at, *_) in domains
             ]
         }
 
@@ -152,24 +213,33 @@ def list_domains(
         )
 
 
-@router.get("/{domain_id}", response_model=dict)
-def get_domain(domain_id: int, db: Session = Depends(get_db)):
+# Only integer ids match here, so /api/domains/export* falls through to
+# the export routes instead of failing validation
+@router.get("/{domain_id:int}", response_model=dict)
+@etag_response()
+async def get_domain(domain_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get detailed information about a specific domain"""
     try:
-        domain = db.query(models.Domain).filter(
-            models.Domain.id == domain_id
-        ).first()
-
-        if not domain:
+        # Fetch the domain and its latest score breakdown in one round-trip
+        scores = aliased(models.DomainScore)
+        latest_score_id = select(scores.id).where(
+            scores.domain_id == models.Domain.id
+        ).order_by(
+            scores.calculated_at.desc()
+        ).limit(1).correlate(models.Domain).scalar_subquery()
+        row = (await db.execute(
+            select(models.Domain, models.DomainScore)
+            .outerjoin(models.DomainScore, models.DomainScore.id == latest_score_id)
+            .where(models.Domain.id == domain_id)
+        )).first()
+
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Domain with ID {domain_id} not found",
             )
 
-        # Get score breakdown
-        score_breakdown = db.query(models.DomainScore).filter(
-            models.DomainScore.domain_id == domain_id
-        ).order_by(models.DomainScore.calculated_at.desc()).first()
+        domain, score_breakdown = row
 
         full_domain = f"{domain.domain_name}.{domain.tld}"
 
@@ -181,7 +251,7 @@ def get_domain(domain_id: int, db: Session = Depends(get_db)):
                 "domain_name": domain.domain_name,
                 "tld": domain.tld,
                 "quality_score": domain.quality_score,
-                "grade": _get_grade(domain.quality_score),
+                "grade": DomainScorer.get_grade(domain.quality_score),
                 "backlinks": domain.backlink_count,
                 "authority": domain.domain_authority,
                 "age_days": domain.domain_age_days,
@@ -193,8 +263,8 @@ def get_domain(domain_id: int, db: Session = Depends(get_db)):
                 "roi_estimate": domain.roi_estimate,
                 "registered": domain.registered,
                 "available": domain.available,
-                "last_checked": domain.last_checked.isoformat() if domain.last_checked else None,
-                "created_at": domain.created_at.isoformat() if domain.created_at else None,
+                "last_checked": domain.last_checked,
+                "created_at": domain.created_at,
                 "score_breakdown": {
                     "age_score": score_breakdown.age_score if score_breakdown else 0,
                     "backlink_score": score_breakdown.backlink_score if score_breakdown else 0,
@@ -204,9 +274,8 @@ def get_domain(domain_id: int, db: Session = Depends(get_db)):
                     "traffic_score": score_breakdown.traffic_score if score_breakdown else 0,
                 } if score_breakdown else {},
                 "buy_links": {
-                    "namecheap": f"https://www.namecheap.com/domains/registration/results/?domain={full_domain}",
-                    "namesilo": f"https://www.namesilo.com/domain/search-domains?query={full_domain}",
-                    "godaddy": f"https://www.godaddy.com/domainsearch/find?isc=gdisd01&ci=9010&k={full_domain}",
+                    registrar: prefix + full_domain
+                    for registrar, prefix in BUY_LINK_PREFIXES.items()
                 },
             }
         }
@@ -222,13 +291,13 @@ def get_domain(domain_id: int, db: Session = Depends(get_db)):
 
 
 @router.post("", response_model=dict, status_code=status.HTTP_201_CREATED)
-def add_domain(
+async def add_domain(
     domain_name: str,
     tld: str,
     quality_score: float = 0,
     backlink_count: int = 0,
     domain_age_days: int = 0,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Manually add a domain to the database
@@ -236,59 +305,55 @@ def add_domain(
     Useful for tracking specific domains you're interested in
     """
     try:
-        # Check if domain already exists
-        existing = db.query(models.Domain).filter(
-            models.Domain.domain_name == domain_name,
-            models.Domain.tld == tld,
-        ).first()
+        # Insert unless the domain already exists, atomically in one statement
+        insert = upsert_insert(db.bind.dialect.name)
+        domain_id = await db.scalar(
+            insert(models.Domain).values(
+                domain_name=domain_name,
+                tld=tld,
+                quality_score=quality_score,
+                backlink_count=backlink_count,
+                domain_age_days=domain_age_days,
+            ).on_conflict_do_nothing(
+                index_elements=["domain_name", "tld"]
+            ).returning(models.Domain.id)
+        )
 
-        if existing:
+        if domain_id is None:
+            await db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=f"{domain_name}.{tld} already exists",
             )
 
-        # Create new domain
-        domain = models.Domain(
-            domain_name=domain_name,
-            tld=tld,
-            quality_score=quality_score,
-            backlink_count=backlink_count,
-            domain_age_days=domain_age_days,
-        )
-
-        db.add(domain)
-        db.commit()
-        db.refresh(domain)
+        await db.commit()
+        response_cache.invalidate("top", "list")
 
         return {
             "success": True,
             "message": f"Domain {domain_name}.{tld} added successfully",
-            "domain_id": domain.id,
+            "domain_id": domain_id,
         }
 
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error adding domain: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error adding domain",
         )
 
 
-def _get_grade(quality_score: float) -> str:
-    """Get letter grade for quality score"""
-    if quality_score >= 85:
-        return "A"
-    elif quality_score >= 70:
-        return "B"
-    elif quality_score >= 55:
-        return "C"
-    elif quality_score >= 40:
-        return "D"
-    elif quality_score >= 25:
-        return "E"
-    else:
-        return "F"
+async def _count_domains(db: AsyncSession, exact: bool) -> int:
+    """Count domains, using Postgres' table statistics unless exact is requested"""
+    if not exact and db.bind.dialect.name == "postgresql":
+        estimate = await db.scalar(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table"),
+            {"table": models.Domain.__tablename__},
+        )
+        # reltuples is -1 until the table has been vacuumed or analyzed
+        if estimate is not None and estimate >= 0:
+            return estimate
+    return await db.scalar(select(func.count()).select_from(models.Domain))
@@ -6,84 +6,251 @@ GET /api/domains/export        - Export all domains as CSV
 GET /api/domains/export/top    - Export top opportunities as CSV
 """
 
+import asyncio
+import hashlib
 import logging
-import csv
-from io import StringIO
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from itertools import count
+from typing import Callable, Iterable, List, Optional
+from fastapi import APIRouter, HTTPException, Request, Response, status, Query
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
-from datetime import datetime
-
-from database import get_db
+from sqlalchemy import Float, case, cast, func, select
+from sqlalchemy.engine import Result, Row
+from datetime import date
+from functools import lru_cache
+
+from analyzers.domain_scorer import DomainScorer
+from database import SessionManager
+from services.response_cache import etag_matches
 import models
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api", tags=["export"])
 
 
+# Exports read from a server-side cursor (stream_results) this many rows
+# at a time, so memory stays O(batch) whatever the table size
+EXPORT_BATCH_SIZE = 1000
+
+# Characters that force a CSV field to be quoted (csv.QUOTE_MINIMAL rules)
+_CSV_SPECIAL = frozenset(',"\r\n')
+
+
+def _csv_text(value: Optional[str]) -> str:
+    """Format a free-text CSV field, quoting it only when it needs to be"""
+    if value is None:
+        return ""
+    if _CSV_SPECIAL.isdisjoint(value):
+        return value
+    return '"' + value.replace('"', '""') + '"'
+
+
+def _blank_if_none(value):
+    """Numeric CSV field that csv.writer would leave empty when missing"""
+    return "" if value is None else value
+
+
+@lru_cache(maxsize=16)
+def _dated_csv_headers(prefix: str, day: date) -> dict:
+    return {"Content-Disposition": f"attachment; filename={prefix}_{day.strftime('%Y%m%d')}.csv"}
+
+
+def _csv_headers(prefix: str) -> dict:
+    """Download headers for today's `<prefix>_YYYYMMDD.csv`, built once per day"""
+    return _dated_csv_headers(prefix, date.today())
+
+
+def _close_stream(result: Result, manager: SessionManager):
+    result.close()
+    manager.close()
+
+
+def _stream_csv(
+    prefix: str,
+    header: List[str],
+    result: Result,
+    to_lines: Callable[[Iterable], Iterable[str]],
+    label: str,
+    manager: SessionManager,
+    extra_headers: Optional[dict] = None,
+) -> StreamingResponse:
+    """
+    Stream a CSV file from a query result as it is read from the DB cursor
+
+    Each batch of `result` is formatted into lines with `to_lines` and sent
+    as one chunk, so memory stays bounded and the first bytes go out
+    immediately. Lines end in CRLF, like csv.writer's default dialect.
+    The stream owns `manager` and closes its session once it finishes.
+
+    Only the blocking cursor reads hop to a worker thread; formatting and
+    sending run on the event loop, so a long export doesn't tie up a
+    threadpool slot for its whole duration.
+    """
+    header_line = ",".join(map(_csv_text, header)) + "\r\n"
+
+    async def row_iter():
+        try:
+            yield header_line
+
+            while partition := await asyncio.to_thread(result.fetchmany, EXPORT_BATCH_SIZE):
+                yield "".join(to_lines(partition))
+        except Exception as e:
+            logger.error(f"Error streaming {label} export: {e}")
+            raise
+        finally:
+            await asyncio.to_thread(_close_stream, result, manager)
+
+    return StreamingResponse(
+        row_iter(),
+        media_type="text/csv",
+        headers={**_csv_headers(prefix), **extra_headers} if extra_headers else _csv_headers(prefix),
+    )
+
+
+# Per-row derived values are computed by the database alongside the
+# columns, so the export loops only format what they receive
+_score = models.Domain.quality_score
+
+# Lower score bound of each grade above the lowest, highest first, from
+# DomainScorer's bands so SQL and Python grades can't diverge
+_GRADE_FLOORS = tuple(zip(DomainScorer.GRADE_THRESHOLDS, DomainScorer.GRADES[1:]))[::-1]
+
+
+def _by_grade(labels: dict, default: str):
+    """CASE mapping quality_score to labels[grade]; labels covers the top grades, lower ones get default"""
+    return case(
+        *((_score >= floor, labels[grade]) for floor, grade in _GRADE_FLOORS if grade in labels),
+        else_=default,
+    )
+
+
+# Letter grade (DomainScorer.get_grade in SQL)
+GRADE_SQL = _by_grade({grade: grade for grade in DomainScorer.GRADES}, DomainScorer.GRADES[0])
+
+# Recommendation and investment level by grade
+RECOMMENDATION_SQL = _by_grade({"A": "STRONG BUY", "B": "BUY", "C": "HOLD"}, "WATCH")
+INVESTMENT_SQL = _by_grade({"A": "Premium", "B": "High", "C": "Medium"}, "Low")
+
+AGE_YEARS_SQL = cast(models.Domain.domain_age_days, Float) / 365.25
+ROI_SQL = func.coalesce(models.Domain.roi_estimate, 0)
+
+# ROI of a portfolio item at its estimated value (0 without a purchase price)
+PORTFOLIO_ROI_SQL = case(
+    (
+        models.PortfolioItem.purchase_price > 0,
+        (models.Domain.price_estimate_high / models.PortfolioItem.purchase_price - 1) * 100,
+    ),
+    else_=0,
+)
+
+# Columns read by the domain exports, in CSV order; selecting them directly
+# skips the wide columns (traffic_json) and ORM object construction
+DOMAIN_EXPORT_COLUMNS = (
+    models.Domain.domain_name,
+    models.Domain.tld,
+    models.Domain.quality_score,
+    GRADE_SQL.label("grade"),
+    models.Domain.backlink_count,
+    models.Domain.domain_authority,
+    models.Domain.domain_age_days,
+    AGE_YEARS_SQL.label("age_years"),
+    models.Domain.price_estimate_low,
+    models.Domain.price_estimate_high,
+    ROI_SQL.label("roi"),
+    models.Domain.registered,
+    models.Domain.available,
+    models.Domain.last_checked,
+    models.Domain.created_at,
+)
+
+# Both domain exports walk ix_domain_quality_desc (quality_score DESC,
+# id DESC) from the top, so rows arrive pre-sorted with no Sort step and
+# the top export's LIMIT stops after `limit` index entries
+EXPORT_ORDER = (models.Domain.quality_score.desc(), models.Domain.id.desc())
+
+# Top exports are per-user downloads, revalidated after a minute
+TOP_EXPORT_CACHE_CONTROL = "private, max-age=60"
+
+# Preformatted rows; only free-text fields go through _csv_text
+PORTFOLIO_ROW = "{},{},{},{},{},{},{},{:.1f},{},{},{},{},{}\r\n"
+DOMAIN_ROW = "{},{},{},{},{},{},{},{:.1f},{},{},{:.1f},{},{},{},{}\r\n"
+TOP_OPPORTUNITY_ROW = "{},{},{},{},{},{},{},{},{:.1f},{},{},{:.0f}%,{},{}\r\n"
+
+
 @router.get("/portfolio/export", response_class=StreamingResponse)
-def export_portfolio_csv(db: Session = Depends(get_db)):
-    """Export portfolio items as CSV file"""
+async def export_portfolio_csv():
+    """Export portfolio items as CSV file, streamed in batches"""
+    # The session belongs to the response stream, not the request handler
+    manager = SessionManager()
     try:
-        items = db.query(models.PortfolioItem).all()
-
-        # Create CSV in memory
-        output = StringIO()
-        writer = csv.writer(output)
-
-        # Write header
-        writer.writerow([
-            "Domain",
-            "TLD",
-            "Purchase Price",
-            "Purchase Date",
-            "Estimated Value",
-            "Quality Score",
-            "Grade",
-            "ROI %",
-            "Status",
-            "Sold Price",
-            "Sold Date",
-            "Notes",
-            "Added Date",
-        ])
-
-        # Write data rows
-        for item in items:
-            domain = item.domain
-            roi = (
-                ((domain.price_estimate_high / item.purchase_price - 1) * 100)
-                if item.purchase_price and item.purchase_price > 0 else 0
+        # Plain column tuples are pulled from the DB cursor in batches as the
+        # response is sent; no ORM objects are built
+        result = await asyncio.to_thread(
+            manager.session.execute,
+            select(
+                models.Domain.domain_name,
+                models.Domain.tld,
+                models.PortfolioItem.purchase_price,
+                models.PortfolioItem.purchase_date,
+                models.Domain.price_estimate_high,
+                models.Domain.quality_score,
+                GRADE_SQL,
+                PORTFOLIO_ROI_SQL,
+                models.PortfolioItem.status,
+                models.PortfolioItem.sold_price,
+                models.PortfolioItem.sold_date,
+                models.PortfolioItem.notes,
+                models.PortfolioItem.added_at,
+            )
+            .join(models.PortfolioItem.domain)
+            .execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE),
+        )
+
+        def to_lines(partition):
+            return (
+                PORTFOLIO_ROW.format(
+                    _csv_text(name),
+                    _csv_text(tld),
+                    purchase_price or "",
+                    purchase_date.date() if purchase_date else "",
+                    estimate_high or "",
+                    _blank_if_none(score),
+                    grade,
+                    roi,
+                    _csv_text(item_status),
+                    sold_price or "",
+                    sold_date.date() if sold_date else "",
+                    _csv_text(notes),
+                    added_at.date() if added_at else "",
+                )
+                for (name, tld, purchase_price, purchase_date, estimate_high, score, grade,
+                     roi, item_status, sold_price, sold_date, notes, added_at) in partition
             )
-            grade = _get_grade(domain.quality_score)
-
-            writer.writerow([
-                domain.domain_name,
-                domain.tld,
-                item.purchase_price or "",
-                item.purchase_date.date() if item.purchase_date else "",
-                domain.price_estimate_high or "",
-                domain.quality_score,
-                grade,
-                f"{roi:.1f}",
-                item.status,
-                item.sold_price or "",
-                item.sold_date.date() if item.sold_date else "",
-                item.notes or "",
-                item.added_at.date() if item.added_at else "",
-            ])
-
-        # Prepare output
-        output.seek(0)
-        filename = f"portfolio_{datetime.now().strftime('%Y%m%d')}.csv"
-
-        return StreamingResponse(
-            iter([output.getvalue()]),
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
+
+        return _stream_csv(
+            "portfolio",
+            [
+                "Domain",
+                "TLD",
+                "Purchase Price",
+                "Purchase Date",
+                "Estimated Value",
+                "Quality Score",
+                "Grade",
+                "ROI %",
+                "Status",
+                "Sold Price",
+                "Sold Date",
+                "Notes",
+                "Added Date",
+            ],
+            result,
+            to_lines,
+            "portfolio",
+            manager,
         )
 
     except Exception as e:
+        manager.close()
         logger.error(f"Error exporting portfolio: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -92,73 +259,71 @@ def export_portfolio_csv(db: Session = Depends(get_db)):
 
 
 @router.get("/domains/export", response_class=StreamingResponse)
-def export_all_domains_csv(
+async def export_all_domains_csv(
     min_score: float = Query(0, ge=0, le=100),
-    db: Session = Depends(get_db),
 ):
-    """Export all domains as CSV file"""
+    """Export all domains as CSV file, streamed in batches"""
+    manager = SessionManager()
     try:
-        domains = db.query(models.Domain).filter(
-            models.Domain.quality_score >= min_score
-        ).order_by(models.Domain.quality_score.desc()).all()
-
-        # Create CSV in memory
-        output = StringIO()
-        writer = csv.writer(output)
-
-        # Write header
-        writer.writerow([
-            "Domain",
-            "TLD",
-            "Quality Score",
-            "Grade",
-            "Backlinks",
-            "Authority",
-            "Age (Days)",
-            "Age (Years)",
-            "Est. Value Low",
-            "Est. Value High",
-            "ROI %",
-            "Registered",
-            "Available",
-            "Last Checked",
-            "Created Date",
-        ])
-
-        # Write data rows
-        for domain in domains:
-            grade = _get_grade(domain.quality_score)
-            roi = domain.roi_estimate or 0
-
-            writer.writerow([
-                domain.domain_name,
-                domain.tld,
-                domain.quality_score,
-                grade,
-                domain.backlink_count,
-                domain.domain_authority or "",
-                domain.domain_age_days,
-                f"{domain.domain_age_days / 365.25:.1f}",
-                domain.price_estimate_low,
-                domain.price_estimate_high,
-                f"{roi:.1f}",
-                "Yes" if domain.registered else "No",
-                "Yes" if domain.available else "No",
-                domain.last_checked.isoformat() if domain.last_checked else "",
-                domain.created_at.date() if domain.created_at else "",
-            ])
-
-        # Prepare output
-        output.seek(0)
-        filename = f"domains_all_{datetime.now().strftime('%Y%m%d')}.csv"
-
-        return StreamingResponse(
-            iter([output.getvalue()]),
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
+        result = await asyncio.to_thread(
+            manager.session.execute,
+            select(*DOMAIN_EXPORT_COLUMNS).where(
+                models.Domain.quality_score >= min_score
+            ).order_by(
+                *EXPORT_ORDER
+            ).execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE),
+        )
+
+        def to_lines(partition):
+            return (
+                DOMAIN_ROW.format(
+                    _csv_text(name),
+                    _csv_text(tld),
+                    _blank_if_none(score),
+                    grade,
+                    _blank_if_none(backlinks),
+                    authority or "",
+                    age_days,
+                    age_years,
+                    _blank_if_none(low),
+                    _blank_if_none(high),
+                    roi,
+                    "Yes" if registered else "No",
+                    "Yes" if available else "No",
+                    last_checked.isoformat() if last_checked else "",
+                    created_at.date() if created_at else "",
+                )
+                for (name, tld, score, grade, backlinks, authority, age_days, age_years,
+                     low, high, roi, registered, available, last_checked, created_at) in partition
+            )
+
+        return _stream_csv(
+            "domains_all",
+            [
+                "Domain",
+                "TLD",
+                "Quality Score",
+                "Grade",
+                "Backlinks",
+                "Authority",
+                "Age (Days)",
+                "Age (Years)",
+                "Est. Value Low",
+                "Est. Value High",
+                "ROI %",
+                "Registered",
+                "Available",
+                "Last Checked",
+                "Created Date",
+            ],
+            result,
+            to_lines,
+            "domains",
+            manager,
         )
 
     except Exception as e:
+        manager.close()
         logger.error(f"Error exporting domains: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -167,97 +332,87 @@ def export_all_domains_csv(
 
 
 @router.get("/domains/export/top", response_class=StreamingResponse)
-def export_top_opportunities_csv(
+async def export_top_opportunities_csv(
+    request: Request,
     limit: int = Query(50, ge=1, le=500),
     min_score: float = Query(70, ge=0, le=100),
-    db: Session = Depends(get_db),
 ):
-    """Export top domain opportunities as CSV file"""
+    """
+    Export top domain opportunities as CSV file, streamed in batches
+
+    The file is only rebuilt when a matching domain changed since the
+    client's copy; otherwise a cheap MAX/COUNT probe answers 304.
+    """
+    manager = SessionManager()
     try:
-        domains = db.query(models.Domain).filter(
-            models.Domain.quality_score >= min_score
-        ).order_by(models.Domain.quality_score.desc()).limit(limit).all()
-
-        # Create CSV in memory
-        output = StringIO()
-        writer = csv.writer(output)
-
-        # Write header with additional recommended metrics
-        writer.writerow([
-            "Rank",
-            "Domain",
-            "TLD",
-            "Quality Score",
-            "Grade",
-            "Recommendation",
-            "Backlinks",
-            "Authority",
-            "Age (Years)",
-            "Est. Value Low",
-            "Est. Value High",
-            "ROI Potential",
-            "Investment Level",
-            "Key Factors",
-        ])
-
-        # Write data rows
-        for rank, domain in enumerate(domains, 1):
-            grade = _get_grade(domain.quality_score)
-            score = domain.quality_score
-            roi = domain.roi_estimate or 0
-            age_years = domain.domain_age_days / 365.25
-
-            # Determine recommendation
-            if score >= 85:
-                recommendation = "STRONG BUY"
-                investment = "Premium"
-            elif score >= 70:
-                recommendation = "BUY"
-                investment = "High"
-            elif score >= 55:
-                recommendation = "HOLD"
-                investment = "Medium"
-            else:
-                recommendation = "WATCH"
-                investment = "Low"
-
-            # Identify key factors
-            factors = []
-            if domain.domain_age_days >= 3650:  # 10 years
-                factors.append("Old domain")
-            if domain.backlink_count >= 100:
-                factors.append("Strong backlinks")
-            if domain.domain_authority and domain.domain_authority >= 40:
-                factors.append("High authority")
-
-            writer.writerow([
-                rank,
-                domain.domain_name,
-                domain.tld,
-                domain.quality_score,
-                grade,
-                recommendation,
-                domain.backlink_count,
-                domain.domain_authority or "",
-                f"{age_years:.1f}",
-                domain.price_estimate_low,
-                domain.price_estimate_high,
-                f"{roi:.0f}%",
-                investment,
-                "; ".join(factors) if factors else "N/A",
-            ])
-
-        # Prepare output
-        output.seek(0)
-        filename = f"top_opportunities_{datetime.now().strftime('%Y%m%d')}.csv"
-
-        return StreamingResponse(
-            iter([output.getvalue()]),
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
+        # Validator for the matching rows: any insert, update or delete among
+        # them changes the latest updated_at or the count
+        last_updated, matching = (await asyncio.to_thread(
+            manager.session.execute,
+            select(func.max(models.Domain.updated_at), func.count()).where(
+                models.Domain.quality_score >= min_score
+            ),
+        )).one()
+        digest = hashlib.blake2b(
+            f"{last_updated}:{matching}:{limit}:{min_score}".encode(), digest_size=16
+        ).hexdigest()
+        etag = f'"{digest}"'
+        cache_headers = {"ETag": f"W/{etag}", "Cache-Control": TOP_EXPORT_CACHE_CONTROL}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            manager.close()
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+        result = await asyncio.to_thread(
+            manager.session.execute,
+            select(
+                *DOMAIN_EXPORT_COLUMNS,
+                RECOMMENDATION_SQL.label("recommendation"),
+                INVESTMENT_SQL.label("investment"),
+            ).where(
+                models.Domain.quality_score >= min_score
+            ).order_by(
+                *EXPORT_ORDER
+            ).limit(limit).execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE),
+        )
+        ranks = count(1)
+
+        def to_lines(partition):
+            # The partition comes first so that zip stops on the exhausted
+            # batch before drawing a rank; otherwise each batch boundary
+            # would skip a rank number
+            return (
+                _top_opportunity_line(rank, domain)
+                for domain, rank in zip(partition, ranks)
+            )
+
+        # Header includes additional recommended metrics
+        return _stream_csv(
+            "top_opportunities",
+            [
+                "Rank",
+                "Domain",
+                "TLD",
+                "Quality Score",
+                "Grade",
+                "Recommendation",
+                "Backlinks",
+                "Authority",
+                "Age (Years)",
+                "Est. Value Low",
+                "Est. Value High",
+                "ROI Potential",
+                "Investment Level",
+                "Key Factors",
+            ],
+            result,
+            to_lines,
+            "top opportunities",
+            manager,
+            cache_headers,
         )
 
     except Exception as e:
+        manager.close()
         logger.error(f"Error exporting top opportunities: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -265,17 +420,30 @@ def export_top_opportunities_csv(
         )
 
 
-def _get_grade(quality_score: float) -> str:
-    """Get letter grade for quality score"""
-    if quality_score >= 85:
-        return "A"
-    elif quality_score >= 70:
-        return "B"
-    elif quality_score >= 55:
-        return "C"
-    elif quality_score >= 40:
-        return "D"
-    elif quality_score >= 25:
-        return "E"
-    else:
-        return "F"
+def _top_opportunity_line(rank: int, domain: Row) -> str:
+    """CSV line for the top opportunities export from a DOMAIN_EXPORT_COLUMNS row"""
+    # Identify key factors
+    factors = []
+    if domain.domain_age_days >= 3650:  # 10 years
+        factors.append("Old domain")
+    if domain.backlink_count >= 100:
+        factors.append("Strong backlinks")
+    if domain.domain_authority and domain.domain_authority >= 40:
+        factors.append("High authority")
+
+    return TOP_OPPORTUNITY_ROW.format(
+        rank,
+        _csv_text(domain.domain_name),
+        _csv_text(domain.tld),
+        _blank_if_none(domain.quality_score),
+        domain.grade,
+        domain.recommendation,
+        _blank_if_none(domain.backlink_count),
+        domain.domain_authority or "",
+        domain.age_years,
+        _blank_if_none(domain.price_estimate_low),
+        _blank_if_none(domain.price_estimate_high),
+        domain.roi,
+        domain.investment,
+        "; ".join(factors) if factors else "N/A",
+    )
@@ -7,45 +7,66 @@ PUT    /api/portfolio/{item_id}    - Update portfolio item
 DELETE /api/portfolio/{item_id}    - Remove from portfolio
 """
 
+import asyncio
 import logging
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload
 from typing import Optional
 from datetime import datetime
 
-from database import get_db
+from database import AsyncSessionLocal, get_async_db
 import models
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/portfolio", tags=["portfolio"])
 
 
-@router.get("", response_model=dict)
-def get_portfolio(db: Session = Depends(get_db)):
+@router.get("", response_class=ORJSONResponse)
+async def get_portfolio(
+    include_items: bool = True,
+    db: AsyncSession = Depends(get_async_db),
+):
     """
     Get user's portfolio summary and all items
 
+    Query Parameters:
+    - include_items: Also return the tracked items (default true); the
+      summary alone is a single aggregate query
+
     Returns portfolio statistics and list of tracked domains
     """
     try:
-        items = db.query(models.PortfolioItem).all()
+        if include_items:
+            # The summary aggregate runs on its own session so both queries
+            # are in flight at the same time
+            items_result, summary = await asyncio.gather(
+                db.scalars(
+                    select(models.PortfolioItem).options(
+                        joinedload(models.PortfolioItem.domain),
+                        # Fail loudly if another relationship is ever lazy-loaded
+                        raiseload("*"),
+                    )
+                ),
+                _portfolio_summary(),
+            )
+            items = items_result.all()
+        else:
+            summary = await _portfolio_summary(db)
 
-        # Calculate portfolio statistics
-        total_domains = len(items)
-        total_invested = sum(i.purchase_price or 0 for i in items)
-        estimated_value = sum(i.domain.price_estimate_high or 0 for i in items)
+        total_domains, total_invested, estimated_value, avg_score = summary
+        total_invested = float(total_invested)
+        estimated_value = float(estimated_value)
+        avg_score = float(avg_score)
 
         # Calculate potential ROI
         potential_roi = 0
         if total_invested > 0:
             potential_roi = ((estimated_value / total_invested) - 1) * 100
 
-        # Calculate average quality score
-        avg_score = 0
-        if items:
-            avg_score = sum(i.domain.quality_score for i in items) / len(items)
-
-        return {
+        response = {
             "success": True,
             "summary": {
                 "total_domains": total_domains,
@@ -54,13 +75,15 @@ def get_portfolio(db: Session = Depends(get_db)):
                 "potential_roi_percent": round(potential_roi, 1),
                 "average_quality_score": round(avg_score, 1),
             },
-            "items": [
+        }
+        if include_items:
+            response["items"] = [
                 {
                     "id": i.id,
                     "domain": f"{i.domain.domain_name}.{i.domain.tld}",
                     "domain_id": i.domain_id,
                     "purchase_price": i.purchase_price,
-                    "purchase_date": i.purchase_date.isoformat() if i.purchase_date else None,
+                    "purchase_date": i.purchase_date,
                     "estimated_value": i.domain.price_estimate_high,
                     "roi_percent": (
                         ((i.domain.price_estimate_high / i.purchase_price - 1) * 100)
@@ -70,12 +93,15 @@ def get_portfolio(db: Session = Depends(get_db)):
                     "quality_score": i.domain.quality_score,
                     "notes": i.notes,
                     "sold_price": i.sold_price,
-                    "sold_date": i.sold_date.isoformat() if i.sold_date else None,
-                    "added_at": i.added_at.isoformat() if i.added_at else None,
+                    "sold_date": i.sold_date,
+                    "added_at": i.added_at,
                 }
                 for i in items
             ]
-        }
+
+        # Returned as a response so FastAPI skips validating and re-encoding
+        # every item; orjson serializes the datetimes itself
+        return ORJSONResponse(response)
 
     except Exception as e:
         logger.error(f"Error fetching portfolio: {e}")
@@ -85,13 +111,36 @@ def get_portfolio(db: Session = Depends(get_db)):
         )
 
 
-@router.post("", status_code=status.HTTP_201_CREATED, response_model=dict)
-def add_to_portfolio(
+async def _portfolio_summary(db: Optional[AsyncSession] = None):
+    """
+    Count, invested total, estimated value and average score in one aggregate query
+
+    Runs on its own session unless one is given, so it can overlap with
+    other queries on the request's session.
+    """
+    if db is None:
+        async with AsyncSessionLocal() as own_db:
+            return await _portfolio_summary(own_db)
+
+    return (await db.execute(
+        select(
+            func.count(models.PortfolioItem.id),
+            func.coalesce(func.sum(models.PortfolioItem.purchase_price), 0),
+            func.coalesce(func.sum(models.Domain.price_estimate_high), 0),
+            func.coalesce(func.avg(models.Domain.quality_score), 0),
+        ).select_from(models.PortfolioItem).join(
+            models.Domain, models.PortfolioItem.domain_id == models.Domain.id
+        )
+    )).one()
+
+
+@router.post("", status_code=status.HTTP_201_CREATED, response_class=ORJSONResponse)
+async def add_to_portfolio(
     domain_id: int,
     purchase_price: Optional[float] = None,
-    status: str = Query("holding", regex="^(holding|sold|monitoring)$"),
+    item_status: str = Query("holding", alias="status", regex="^(holding|sold|monitoring)$"),
     notes: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Add a domain to user's portfolio
@@ -103,41 +152,46 @@ def add_to_portfolio(
     - notes: Optional notes about the domain
     """
     try:
-        # Verify domain exists
-        domain = db.query(models.Domain).filter(
-            models.Domain.id == domain_id
-        ).first()
-
-        if not domain:
+        # Verify domain exists and isn't already held, in one query
+        row = (await db.execute(
+            select(
+                models.Domain.domain_name,
+                models.Domain.tld,
+                models.PortfolioItem.id,
+            ).outerjoin(
+                models.PortfolioItem,
+                and_(
+                    models.PortfolioItem.domain_id == models.Domain.id,
+                    models.PortfolioItem.status != "sold",
+                ),
+            ).where(models.Domain.id == domain_id).limit(1)
+        )).first()
+
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Domain with ID {domain_id} not found",
             )
 
-        # Check if already in portfolio
-        existing = db.query(models.PortfolioItem).filter(
-            models.PortfolioItem.domain_id == domain_id,
-            models.PortfolioItem.status != "sold",
-        ).first()
-
-        if existing:
+        domain_name, tld, existing_id = row
+        if existing_id:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
-                detail=f"{domain.domain_name}.{domain.tld} already in portfolio",
+                detail=f"{domain_name}.{tld} already in portfolio",
             )
 
         # Create portfolio item
         item = models.PortfolioItem(
             domain_id=domain_id,
             purchase_price=purchase_price,
-            status=status,
+            status=item_status,
             notes=notes,
             purchase_date=datetime.now() if purchase_price else None,
         )
 
         db.add(item)
-        db.commit()
-        db.refresh(item)
+        await db.commit()
+        await db.refresh(item)
 
         return {
             "success": True,
@@ -149,27 +203,25 @@ def add_to_portfolio(
         raise
     except Exception as e:
         logger.error(f"Error adding to portfolio: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error adding to portfolio",
         )
 
 
-@router.put("/{item_id}", response_model=dict)
-def update_portfolio_item(
+@router.put("/{item_id}", response_class=ORJSONResponse)
+async def update_portfolio_item(
     item_id: int,
     purchase_price: Optional[float] = None,
-    status: Optional[str] = None,
+    item_status: Optional[str] = Query(None, alias="status"),
     notes: Optional[str] = None,
     sold_price: Optional[float] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Update portfolio item"""
     try:
-        item = db.query(models.PortfolioItem).filter(
-            models.PortfolioItem.id == item_id
-        ).first()
+        item = await db.get(models.PortfolioItem, item_id)
 
         if not item:
             raise HTTPException(
@@ -180,8 +232,8 @@ def update_portfolio_item(
         # Update fields
         if purchase_price is not None:
             item.purchase_price = purchase_price
-        if status is not None:
-            item.status = status
+        if item_status is not None:
+            item.status = item_status
         if notes is not None:
             item.notes = notes
         if sold_price is not None:
@@ -191,7 +243,7 @@ def update_portfolio_item(
 
         item.updated_at = datetime.now()
 
-        db.commit()
+        await db.commit()
 
         return {
             "success": True,
@@ -203,20 +255,25 @@ def update_portfolio_item(
         raise
     except Exception as e:
         logger.error(f"Error updating portfolio: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error updating portfolio",
         )
 
 
-@router.delete("/{item_id}", response_model=dict)
-def remove_from_portfolio(item_id: int, db: Session = Depends(get_db)):
+@router.delete("/{item_id}", response_class=ORJSONResponse)
+async def remove_from_portfolio(item_id: int, db: AsyncSession = Depends(get_async_db)):
     """Remove item from portfolio"""
     try:
-        item = db.query(models.PortfolioItem).filter(
-            models.PortfolioItem.id == item_id
-        ).first()
+        item = await db.get(
+            models.PortfolioItem, item_id,
+            options=[
+                joinedload(models.PortfolioItem.domain).load_only(
+                    models.Domain.domain_name, models.Domain.tld
+                )
+            ],
+        )
 
         if not item:
             raise HTTPException(
@@ -225,8 +282,8 @@ def remove_from_portfolio(item_id: int, db: Session = Depends(get_db)):
             )
 
         domain_name = f"{item.domain.domain_name}.{item.domain.tld}"
-        db.delete(item)
-        db.commit()
+        await db.delete(item)
+        await db.commit()
 
         return {
             "success": True,
@@ -237,7 +294,7 @@ def remove_from_portfolio(item_id: int, db: Session = Depends(get_db)):
         raise
     except Exception as e:
         logger.error(f"Error removing from portfolio: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error removing from portfolio",
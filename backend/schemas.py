@@ -40,14 +40,18 @@ class DomainResponse(DomainBase):
     class Config:
         from_attributes = True
 
+# Registrar search URLs; the full domain name is appended to each
+BUY_LINK_PREFIXES = {
+    "namecheap": "https://www.namecheap.com/domains/registration/results/?domain=",
+    "namesilo": "https://www.namesilo.com/domain/search-domains?query=",
+    "godaddy": "https://www.godaddy.com/domainsearch/find?isc=gdisd01&ci=9010&k=",
+}
+
 class DomainDetailResponse(DomainResponse):
     """Extended response with all details"""
     traffic_json: Optional[dict]
-    buy_links: dict = {
-        "namecheap": "https://www.namecheap.com/domains/registration/results/?domain=",
-        "namesilo": "https://www.namesilo.com/domain/search-domains?query=",
-        "godaddy": "https://www.godaddy.com/domainsearch/find?isc=gdisd01&ci=9010&k=",
-    }
+    # Shared, never mutated: no per-instance copy of the default
+    buy_links: dict = Field(default_factory=lambda: BUY_LINK_PREFIXES)
 
     class Config:
         from_attributes = True
@@ -7,11 +7,12 @@ Cost: $2-5/month for ~50K domains/month (depending on usage tier)
 Alternative: Use free tier for manual runs, or schedule via GitHub Actions
 """
 
+import asyncio
 import httpx
 import logging
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional
 import time
-import json
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +23,13 @@ class ExpiredDomainsScraper:
     APIFY_API_URL = "https://api.apify.com/v2"
     APIFY_ACTOR_ID = "Dexnis/expireddomains-scraper"  # Apify actor for ExpiredDomains
 
+    # Run status polling backs off from the first to the max interval (seconds)
+    POLL_INITIAL_DELAY = 1.0
+    POLL_MAX_DELAY = 15.0
+
+    # Dataset items fetched per request
+    DATASET_PAGE_SIZE = 1000
+
     def __init__(self, apify_token: str):
         """
         Initialize scraper with Apify API token
@@ -30,7 +38,8 @@ class ExpiredDomainsScraper:
             apify_token: Apify API token (get from https://apify.com)
         """
         self.apify_token = apify_token
-        self.session = httpx.Client(timeout=30.0)
+        # Async client so Apify calls never block the event loop
+        self.session = httpx.AsyncClient(timeout=30.0)
 
     async def scrape_expired_domains(
         self,
@@ -72,7 +81,7 @@ class ExpiredDomainsScraper:
             }
 
             logger.info(f"Calling Apify actor with input: {actor_input}")
-            response = self.session.post(
+            response = await self.session.post(
                 run_url,
                 json={"input": actor_input},
                 headers=headers,
@@ -101,12 +110,18 @@ class ExpiredDomainsScraper:
             return []
 
     async def _wait_for_run(self, run_id: str, headers: Dict, timeout: int = 300) -> Dict:
-        """Wait for Apify actor run to complete (with timeout)"""
+        """
+        Wait for Apify actor run to complete (with timeout)
+
+        Polls with exponential backoff (1s, 2s, 4s, 8s, then every 15s):
+        short runs are picked up quickly and long ones cost few calls.
+        """
         url = f"{self.APIFY_API_URL}/acts/{self.APIFY_ACTOR_ID}/runs/{run_id}"
-        start_time = time.time()
+        start_time = time.monotonic()
+        delay = self.POLL_INITIAL_DELAY
 
-        while time.time() - start_time < timeout:
-            response = self.session.get(url, headers=headers)
+        while time.monotonic() - start_time < timeout:
+            response = await self.session.get(url, headers=headers)
             response.raise_for_status()
             run_info = response.json()["data"]
 
@@ -114,7 +129,8 @@ class ExpiredDomainsScraper:
                 return run_info
 
             logger.info(f"Waiting for Apify run... status: {run_info['status']}")
-            time.sleep(5)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.POLL_MAX_DELAY)
 
         raise TimeoutError(f"Apify run {run_id} timed out after {timeout}s")
 
@@ -122,7 +138,7 @@ class ExpiredDomainsScraper:
         """Fetch dataset results from completed Apify run"""
         # Get dataset ID from run
         run_url = f"{self.APIFY_API_URL}/acts/{self.APIFY_ACTOR_ID}/runs/{run_id}"
-        response = self.session.get(run_url, headers=headers)
+        response = await self.session.get(run_url, headers=headers)
         response.raise_for_status()
         run_data = response.json()["data"]
 
@@ -131,27 +147,46 @@ class ExpiredDomainsScraper:
             logger.error("No dataset found in run results")
             return []
 
-        # Fetch dataset items
-        dataset_url = f"{self.APIFY_API_URL}/datasets/{dataset_id}/items"
-        response = self.session.get(
-            dataset_url,
-            headers=headers,
-            params={"format": "json"},
-        )
-        response.raise_for_status()
-
-        items = response.json()
-        logger.info(f"Retrieved {len(items)} items from dataset")
-
-        # Parse and normalize domain data
+        # Parse and normalize domain data as the dataset pages stream in
         domains = []
-        for item in items:
+        item_count = 0
+        async for item in self._iter_dataset_items(dataset_id, headers):
+            item_count += 1
             domain_data = self._parse_domain_item(item)
             if domain_data:
                 domains.append(domain_data)
 
+        logger.info(f"Retrieved {item_count} items from dataset")
         return domains
 
+    async def _iter_dataset_items(self, dataset_id: str, headers: Dict) -> AsyncIterator[Dict]:
+        """
+        Yield raw dataset items, DATASET_PAGE_SIZE at a time
+
+        Pages are requested as JSON lines and decoded line by line while the
+        response streams in, so only one page is ever held in memory.
+        """
+        dataset_url = f"{self.APIFY_API_URL}/datasets/{dataset_id}/items"
+        offset = 0
+
+        while True:
+            page_count = 0
+            async with self.session.stream(
+                "GET",
+                dataset_url,
+                headers=headers,
+                params={"format": "jsonl", "offset": offset, "limit": self.DATASET_PAGE_SIZE},
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if line.strip():
+                        page_count += 1
+                        yield orjson.loads(line)
+
+            if page_count < self.DATASET_PAGE_SIZE:
+                return
+            offset += page_count
+
     @staticmethod
     def _parse_domain_item(item: Dict) -> Optional[Dict]:
         """
@@ -165,51 +200,57 @@ class ExpiredDomainsScraper:
         - backlinks: 45
         - etc.
         """
+        get = item.get
         try:
-            domain_full = item.get("domain", "").lower().strip()
-            if not domain_full or "." not in domain_full:
+            if not (domain_full := get("domain")):
+                return None
+            domain_full = domain_full.lower().strip()
+            if "." not in domain_full:
                 return None
 
             # Split domain and TLD
-            parts = domain_full.rsplit(".", 1)
-            domain_name = parts[0]
-            tld = parts[1] if len(parts) > 1 else ""
-
-            # Parse age
-            age_years = 0
-            age_str = str(item.get("domainAge", "0"))
-            try:
-                age_years = int(float(age_str))
-            except:
-                pass
+            domain_name, tld = domain_full.rsplit(".", 1)
+
+            # Parse age (malformed ages count as 0)
+            age_years = get("domainAge") or 0
+            if type(age_years) is not int:
+                try:
+                    age_years = int(float(age_years))
+                except (TypeError, ValueError):
+                    age_years = 0
+
+            # Numeric fields usually arrive as JSON numbers; only coerce others
+            backlinks = get("backlinks") or 0
+            traffic = get("traffic") or 0
+            price = get("price") or 0
 
             return {
                 "domain_name": domain_name,
                 "tld": tld,
                 "full_domain": domain_full,
-                "backlink_count": int(item.get("backlinks", 0) or 0),
+                "backlink_count": backlinks if type(backlinks) is int else int(backlinks),
                 "domain_age_days": age_years * 365,
-                "price": float(item.get("price", 0) or 0),
-                "traffic": int(item.get("traffic", 0) or 0),
-                "status": item.get("status", "available"),
-                "registered": item.get("registered", False),
-                "registrar": item.get("registrar", ""),
-                "expiration_date": item.get("expirationDate"),
+                "price": price if type(price) is float else float(price),
+                "traffic": traffic if type(traffic) is int else int(traffic),
+                "status": get("status", "available"),
+                "registered": get("registered", False),
+                "registrar": get("registrar", ""),
+                "expiration_date": get("expirationDate"),
             }
 
         except Exception as e:
             logger.warning(f"Error parsing domain item: {e}")
             return None
 
-    def close(self):
+    async def aclose(self):
         """Close HTTP session"""
-        self.session.close()
+        await self.session.aclose()
 
-    def __enter__(self):
+    async def __aenter__(self):
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
 
 
 class LocalDomainListScraper:
@@ -236,7 +277,8 @@ class LocalDomainListScraper:
     ]
 
     @staticmethod
-    async def scrape_sample_domains(limit: int = 20) -> List[Dict]:
-        """Return sample domains for testing"""
+    async def scrape_sample_domains(limit: int = 20) -> AsyncIterator[Dict]:
+        """Yield sample domains for testing, one at a time like a live feed"""
         logger.info(f"Using sample domains for testing (limit={limit})")
-        return LocalDomainListScraper.SAMPLE_DOMAINS[:limit]
+        for domain in LocalDomainListScraper.SAMPLE_DOMAINS[:limit]:
+            yield domain
@@ -8,22 +8,147 @@ Features:
 - Batch notifications with top opportunities
 """
 
+import asyncio
 import logging
 import os
 import json
-from typing import List, Dict, Optional
+import random
+import time
+from bisect import bisect_right
+from itertools import islice
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
+from html import escape
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import httpx
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 import models
+from services.query_counter import count_queries
 
 logger = logging.getLogger(__name__)
 
 
+# Alert subscriptions are streamed from the DB this many at a time
+ALERT_BATCH_SIZE = 500
+
+# Subscriber deliveries in flight at once during an alert run
+ALERT_CONCURRENCY = 20
+
+# Domains included in each alert
+ALERT_MAX_DOMAINS = 20
+
+# SendGrid accepts at most this many personalizations per request
+SENDGRID_MAX_RECIPIENTS = 1000
+
+# SendGrid's documented sustained limit for mail/send (requests per second)
+SENDGRID_RATE_LIMIT = 100
+
+# Slack accepts about one message per second per incoming webhook
+SLACK_RATE_LIMIT = 1
+
+# Attempts per POST when the provider turns the request away or it never
+# left this host; waits grow exponentially with jitter, honouring
+# Retry-After when given
+POST_MAX_ATTEMPTS = 5
+POST_RETRY_BASE_DELAY = 1.0
+POST_RETRY_MAX_DELAY = 30.0
+
+# Sends aren't idempotent: a timeout or dropped connection after the request
+# went out may follow an accepted send, and retrying it would mail every
+# recipient twice. Only statuses that mean "not processed" and errors raised
+# before the request was written are retried; anything else is reported as
+# undelivered and left to the AlertWorker
+POST_RETRY_STATUSES = frozenset({429, 503})
+_POST_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+# Daily digest email markup, split around its per-send parts (the domain
+# count and the table rows) so the static page is never re-interpolated;
+# renders only format the rows and join the pieces
+_EMAIL_HEADER = """
+        <html>
+        <head>
+            <style>
+                body { font-family: Arial, sans-serif; color: #333; }
+                .container { max-width: 900px; margin: 0 auto; padding: 20px; }
+                h1 { color: #2196F3; }
+                table { width: 100%; border-collapse: collapse; }
+                th { background: #2196F3; color: white; padding: 12px; text-align: left; }
+                .grade-a { color: #4CAF50; font-weight: bold; }
+                .grade-b { color: #2196F3; font-weight: bold; }
+                .grade-c { color: #FF9800; font-weight: bold; }
+                .footer { margin-top: 30px; padding-top: 20px; border-top: 1px solid #ddd; font-size: 12px; color: #666; }
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <h1>🎯 Domain Finder Pro - Daily Opportunities</h1>
+                <p>Hello,</p>
+                <p>Here are today's top """
+
+_EMAIL_TABLE_START = """ domain opportunities matching your criteria:</p>
+
+                <table>
+                    <thead>
+                        <tr>
+                            <th>#</th>
+                            <th>Domain</th>
+                            <th>Score</th>
+                            <th>Est. Value</th>
+                            <th>ROI</th>
+                            <th>Backlinks</th>
+                        </tr>
+                    </thead>
+                    <tbody>"""
+
+_EMAIL_FOOTER = """
+                    </tbody>
+                </table>
+
+                <div class="footer">
+                    <p>💡 Scores are based on domain age, backlinks, authority, brandability, keywords, and traffic.</p>
+                    <p>© Domain Finder Pro - Your automated domain investment assistant</p>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+
+# Alert fields used for filtering and delivery
+ALERT_COLUMNS = (
+    models.Alert.email,
+    models.Alert.slack_webhook,
+    models.Alert.min_quality_score,
+    models.Alert.min_domain_age,
+    models.Alert.max_domain_age,
+    models.Alert.min_backlinks,
+)
+
+
+class _TokenBucket:
+    """Async token bucket allowing `rate` acquisitions per second, bursting to `rate`"""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
 class AlertService:
     """Manages notifications for top domain opportunities"""
 
@@ -32,58 +157,101 @@ class AlertService:
         self.sendgrid_api_key = os.getenv("SENDGRID_API_KEY")
         self.slack_webhook = os.getenv("SLACK_WEBHOOK")
         self.sendgrid_from_email = os.getenv("SENDGRID_FROM_EMAIL", "noreply@domainfinder.pro")
-
-    def send_daily_alerts(self, db_session: Session, top_domains: List[Dict]) -> Dict:
+        # One pooled HTTP/2 client for the service's lifetime, so SendGrid
+        # and Slack connections (and their TLS sessions) are reused across
+        # sends and alert runs. Auth headers stay per request: the SendGrid
+        # key must never reach Slack webhooks.
+        self.session = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+        # Concurrent deliveries are paced to each provider's rate limit
+        # instead of tripping 429s
+        self.sendgrid_limiter = _TokenBucket(SENDGRID_RATE_LIMIT)
+        self.slack_limiters: Dict[str, _TokenBucket] = {}
+
+    @count_queries("send_daily_alerts")
+    async def send_daily_alerts(self, db_session: Session, top_domains: List[Dict]) -> Dict:
         """
         Send daily digest to all subscribers
 
+        Subscribers with the same filters receive the same digest, so they
+        are grouped and each group's domains are filtered once and emailed
+        in one SendGrid request per SENDGRID_MAX_RECIPIENTS recipients.
+        Requests run concurrently (at most ALERT_CONCURRENCY in flight) over
+        the service's pooled HTTP/2 client.
+
         Args:
             db_session: Database session
             top_domains: List of top opportunity dicts
 
         Returns:
-            {"email_sent": 0, "slack_sent": 0, "errors": []}
+            {"email_sent": 0, "slack_sent": 0, "skipped": 0, "errors": [], "retryable": False}
+
+            skipped counts recipients of unconfigured channels (email without
+            SENDGRID_API_KEY); retryable is set when a delivery failed in a
+            way a later attempt may fix (connection error, 429 or 5xx)
         """
         results = {
             "email_sent": 0,
             "slack_sent": 0,
+            "skipped": 0,
             "errors": [],
+            "retryable": False,
         }
 
         try:
-            # Get all enabled alerts
-            alerts = db_session.query(models.Alert).filter(
-                models.Alert.enabled == True
-            ).all()
+            # The subscriber query is blocking, so it runs in a worker
+            # thread and the event loop keeps serving requests meanwhile
+            groups, subscriber_count = await asyncio.to_thread(
+                self._load_subscriber_groups, db_session
+            )
 
-            logger.info(f"Sending alerts to {len(alerts)} subscribers...")
+            logger.info(f"Sending alerts to {subscriber_count} subscribers in {len(groups)} filter groups...")
 
-            # Filter top domains by alert criteria
-            for alert in alerts:
-                filtered_domains = self._filter_domains(top_domains, alert)
+            ranking = self._rank_domains(top_domains)
+            semaphore = asyncio.Semaphore(ALERT_CONCURRENCY)
+            deliveries = []
+            # Groups with different filters often end up with the same
+            # domains; render each distinct digest once per run
+            email_html: Dict[tuple, str] = {}
+            slack_payloads: Dict[tuple, Dict] = {}
+            for group in groups.values():
+                # Filter top domains by the group's alert criteria
+                filtered_domains = self._filter_domains(top_domains, group["alert"], ranking)
 
                 if not filtered_domains:
-                    logger.debug(f"No qualifying domains for {alert.email}")
+                    logger.debug(f"No qualifying domains for {len(group['emails'])} subscribers")
                     continue
 
-                # Send email
-                if alert.email:
-                    try:
-                        self.send_email_alert(alert.email, filtered_domains)
-                        results["email_sent"] += 1
-                    except Exception as e:
-                        logger.error(f"Email error for {alert.email}: {e}")
-                        results["errors"].append(f"Email {alert.email}: {str(e)}")
-
-                # Send Slack
-                if alert.slack_webhook:
-                    try:
-                        self.send_slack_alert(alert.slack_webhook, filtered_domains)
-                        results["slack_sent"] += 1
-                    except Exception as e:
-                        logger.error(f"Slack error: {e}")
-                        results["errors"].append(f"Slack: {str(e)}")
-
+                digest_key = tuple(domain["domain"] for domain in filtered_domains)
+
+                emails = list(group["emails"])
+                if emails:
+                    if digest_key not in email_html:
+                        email_html[digest_key] = self._build_email_html(filtered_domains)
+                    for start in range(0, len(emails), SENDGRID_MAX_RECIPIENTS):
+                        deliveries.append(self._deliver_email(
+                            semaphore,
+                            emails[start:start + SENDGRID_MAX_RECIPIENTS],
+                            filtered_domains,
+                            email_html[digest_key],
+                            results,
+                        ))
+
+                if group["webhooks"]:
+                    if digest_key not in slack_payloads:
+                        slack_payloads[digest_key] = self._build_slack_payload(filtered_domains)
+                    for webhook_url in group["webhooks"]:
+                        deliveries.append(self._deliver_slack(
+                            semaphore, webhook_url, filtered_domains, slack_payloads[digest_key], results
+                        ))
+
+            await asyncio.gather(*deliveries, return_exceptions=True)
+
+            if results["skipped"]:
+                logger.warning(f"SENDGRID_API_KEY not set, skipped {results['skipped']} email recipients")
             logger.info(f"Alert results: {results}")
             return results
 
@@ -92,39 +260,134 @@ class AlertService:
             results["errors"].append(str(e))
             return results
 
+    async def _deliver_email(
+        self,
+        semaphore: asyncio.Semaphore,
+        emails: List[str],
+        domains: List[Dict],
+        html_content: str,
+        results: Dict,
+    ):
+        """Email one digest to a batch of subscribers, recording the outcome in results"""
+        # Without an API key nothing is attempted, and retrying can't help
+        if not self.sendgrid_api_key:
+            results["skipped"] += len(emails)
+            return
+
+        label = f"Email batch of {len(emails)}"
+        async with semaphore:
+            try:
+                response = await self._send_via_sendgrid(emails, self._email_subject(domains), html_content)
+                if self._sendgrid_accepted(response, len(emails)):
+                    results["email_sent"] += len(emails)
+                else:
+                    self._record_failure(results, label, status_code=response.status_code)
+            except Exception as e:
+                logger.error(f"Email error for {len(emails)} recipients: {e}")
+                self._record_failure(results, label, error=e)
+
+    async def _deliver_slack(
+        self,
+        semaphore: asyncio.Semaphore,
+        webhook_url: str,
+        domains: List[Dict],
+        payload: Dict,
+        results: Dict,
+    ):
+        """Post one Slack digest, recording the outcome in results"""
+        async with semaphore:
+            try:
+                response = await self._post_slack(webhook_url, payload)
+                if self._slack_accepted(response):
+                    results["slack_sent"] += 1
+                else:
+                    self._record_failure(results, "Slack", status_code=response.status_code)
+            except Exception as e:
+                logger.error(f"Slack error: {e}")
+                self._record_failure(results, "Slack", error=e)
+
     @staticmethod
-    def _filter_domains(domains: List[Dict], alert: models.Alert) -> List[Dict]:
-        """Filter domains by alert criteria"""
-        filtered = []
+    def _record_failure(
+        results: Dict,
+        label: str,
+        status_code: Optional[int] = None,
+        error: Optional[Exception] = None,
+    ):
+        """Record a failed delivery, flagging the run retryable if the failure may be transient"""
+        results["errors"].append(f"{label}: {error}" if error is not None else f"{label}: HTTP {status_code}")
+        if isinstance(error, httpx.TransportError) or (
+            status_code is not None and (status_code == 429 or status_code >= 500)
+        ):
+            results["retryable"] = True
 
-        for domain in domains:
-            # Check quality score threshold
-            if domain.get("score", {}).get("total_score", 0) < alert.min_quality_score:
-                continue
+    @staticmethod
+    def _rank_domains(domains: List[Dict]) -> Tuple[List[Dict], List[tuple], List[float]]:
+        """
+        Sort domains by total score, highest first, reading their metrics once
 
-            # Check domain age filters
-            age_days = domain.get("analysis", {}).get("domain_age_days", 0)
-            if age_days < alert.min_domain_age or age_days > alert.max_domain_age:
-                continue
+        Returns the sorted domains, their (total_score, domain_age_days,
+        backlink_count) tuples and their negated scores (ascending, for
+        bisect). Equal scores keep their original order.
+        """
+        ranked = sorted(
+            (
+                (
+                    (
+                        domain.get("score", {}).get("total_score", 0),
+                        domain.get("analysis", {}).get("domain_age_days", 0),
+                        domain.get("analysis", {}).get("backlink_count", 0),
+                    ),
+                    domain,
+                )
+                for domain in domains
+            ),
+            key=lambda pair: -pair[0][0],
+        )
+        metrics = [metric for metric, _ in ranked]
+        return [domain for _, domain in ranked], metrics, [-metric[0] for metric in metrics]
 
-            # Check backlink minimum
-            backlinks = domain.get("analysis", {}).get("backlink_count", 0)
-            if backlinks < alert.min_backlinks:
-                continue
+    @staticmethod
+    def _filter_domains(
+        domains: List[Dict], alert, ranking: Optional[Tuple] = None
+    ) -> List[Dict]:
+        """
+        Filter domains by alert criteria (alert is a row of ALERT_COLUMNS)
+
+        `ranking` is _rank_domains(domains), precomputed once per run. Since
+        domains are ranked by score, a bisect finds the ones above the
+        alert's threshold and only that prefix is scanned for the age and
+        backlink filters, stopping after ALERT_MAX_DOMAINS matches.
+        """
+        ranked_domains, metrics, neg_scores = ranking or AlertService._rank_domains(domains)
 
-            filtered.append(domain)
+        cutoff = bisect_right(neg_scores, -alert.min_quality_score)
+        min_age = alert.min_domain_age
+        max_age = alert.max_domain_age
+        min_backlinks = alert.min_backlinks
 
-        return filtered[:20]  # Limit to 20 per alert
+        matches = (
+            domain
+            for domain, (_, age_days, backlinks) in zip(ranked_domains[:cutoff], metrics)
+            if min_age <= age_days <= max_age and backlinks >= min_backlinks
+        )
+        return list(islice(matches, ALERT_MAX_DOMAINS))
 
-    def send_email_alert(self, email: str, domains: List[Dict]) -> bool:
+    async def send_email_alert(self, email: str, domains: List[Dict]) -> bool:
         """Send email alert with top opportunities"""
+        return await self.send_bulk_email_alert([email], domains)
+
+    async def send_bulk_email_alert(
+        self, emails: List[str], domains: List[Dict], html_content: Optional[str] = None
+    ) -> bool:
+        """Send the same email alert to several recipients in one request"""
         try:
-            subject = f"🎯 Domain Finder Pro - Top {len(domains)} Opportunities"
-            html_content = self._build_email_html(domains)
+            if html_content is None:
+                html_content = self._build_email_html(domains)
 
             # SendGrid API call
             if self.sendgrid_api_key:
-                return self._send_via_sendgrid(email, subject, html_content)
+                response = await self._send_via_sendgrid(emails, self._email_subject(domains), html_content)
+                return self._sendgrid_accepted(response, len(emails))
 
             # Fallback to direct SMTP (requires mail server)
             return False
@@ -133,52 +396,124 @@ class AlertService:
             logger.error(f"Email send error: {e}")
             return False
 
-    def _send_via_sendgrid(self, to_email: str, subject: str, html_content: str) -> bool:
-        """Send email via SendGrid API"""
-        try:
-            headers = {
-                "Authorization": f"Bearer {self.sendgrid_api_key}",
-                "Content-Type": "application/json",
-            }
+    @staticmethod
+    def _email_subject(domains: List[Dict]) -> str:
+        """Subject line of the daily digest email"""
+        return f"🎯 Domain Finder Pro - Top {len(domains)} Opportunities"
 
-            payload = {
-                "personalizations": [
-                    {
-                        "to": [{"email": to_email}],
-                        "subject": subject,
-                    }
-                ],
-                "from": {"email": self.sendgrid_from_email},
-                "content": [
-                    {
-                        "type": "text/html",
-                        "value": html_content,
-                    }
-                ],
-            }
+    async def _send_via_sendgrid(
+        self, to_emails: List[str], subject: str, html_content: str
+    ) -> httpx.Response:
+        """
+        Send email via SendGrid API, returning its response
 
-            response = httpx.post(
-                "https://api.sendgrid.com/v3/mail/send",
-                json=payload,
-                headers=headers,
-                timeout=10.0,
-            )
+        Each recipient gets its own personalization, so nobody sees the
+        other addresses; subject and content are shared at the top level.
+        Connection errors are raised to the caller.
+        """
+        headers = {
+            "Authorization": f"Bearer {self.sendgrid_api_key}",
+            "Content-Type": "application/json",
+        }
 
-            if response.status_code in [200, 202]:
-                logger.info(f"Email sent to {to_email}")
-                return True
-            else:
-                logger.error(f"SendGrid error: {response.text}")
-                return False
+        payload = {
+            "personalizations": [
+                {"to": [{"email": to_email}]}
+                for to_email in to_emails
+            ],
+            "subject": subject,
+            "from": {"email": self.sendgrid_from_email},
+            "content": [
+                {
+                    "type": "text/html",
+                    "value": html_content,
+                }
+            ],
+        }
 
-        except Exception as e:
-            logger.error(f"SendGrid API error: {e}")
-            return False
+        return await self._post(
+            self.sendgrid_limiter,
+            "https://api.sendgrid.com/v3/mail/send",
+            json=payload,
+            headers=headers,
+        )
+
+    @staticmethod
+    def _sendgrid_accepted(response: httpx.Response, recipient_count: int) -> bool:
+        """Whether SendGrid accepted the send, logging the outcome"""
+        if response.status_code in [200, 202]:
+            logger.info(f"Email sent to {recipient_count} recipients")
+            return True
+        logger.error(f"SendGrid error: {response.text}")
+        return False
+
+    async def _post(self, limiter: _TokenBucket, url: str, **kwargs) -> httpx.Response:
+        """
+        POST through the rate limiter, retrying requests that weren't processed
+
+        Returns the last response; connection errors are raised to the
+        caller once retries run out, or straight away when the request may
+        already have been received
+        """
+        for attempt in range(1, POST_MAX_ATTEMPTS + 1):
+            await limiter.acquire()
+            try:
+                response = await self.session.post(url, **kwargs)
+            except _POST_UNSENT_ERRORS as e:
+                if attempt == POST_MAX_ATTEMPTS:
+                    raise
+                logger.warning(f"POST to {httpx.URL(url).host} failed ({e}), retrying")
+                await asyncio.sleep(self._retry_delay(attempt))
+                continue
+
+            if response.status_code not in POST_RETRY_STATUSES:
+                return response
+            if attempt == POST_MAX_ATTEMPTS:
+                return response
+
+            logger.warning(f"POST to {httpx.URL(url).host} returned {response.status_code}, retrying")
+            await asyncio.sleep(self._retry_delay(attempt, response.headers.get("Retry-After")))
+        return response
+
+    @staticmethod
+    def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before the next attempt: Retry-After if given, else jittered exponential"""
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), POST_RETRY_MAX_DELAY)
+        return min(POST_RETRY_MAX_DELAY, POST_RETRY_BASE_DELAY * 2 ** (attempt - 1) + random.uniform(0, 1))
+
+    @staticmethod
+    def _load_subscriber_groups(db_session: Session) -> Tuple[Dict[tuple, Dict], int]:
+        """
+        Enabled subscribers grouped by their filter settings
+
+        Returns (groups, subscriber_count); each group holds one alert row
+        with the group's filters, its de-duplicated emails and its webhooks
+        """
+        # Stream enabled alerts in batches as plain rows; Alert has no
+        # relationships, so one query covers every subscriber
+        alerts = db_session.execute(
+            select(*ALERT_COLUMNS).where(
+                models.Alert.enabled == True
+            ).execution_options(yield_per=ALERT_BATCH_SIZE)
+        )
+
+        groups: Dict[tuple, Dict] = {}
+        subscriber_count = 0
+        for alert in alerts:
+            subscriber_count += 1
+            key = (alert.min_quality_score, alert.min_domain_age, alert.max_domain_age, alert.min_backlinks)
+            group = groups.setdefault(key, {"alert": alert, "emails": {}, "webhooks": []})
+            if alert.email:
+                group["emails"][alert.email] = None  # de-duplicated, in order
+            if alert.slack_webhook:
+                group["webhooks"].append(alert.slack_webhook)
+        return groups, subscriber_count
 
     @staticmethod
     def _build_email_html(domains: List[Dict]) -> str:
-        """Build HTML email content"""
-        rows = ""
+        """Build HTML email content around the module-level digest markup"""
+        rows = []
         for i, domain in enumerate(domains, 1):
             score = domain.get("score", {}).get("total_score", 0)
             grade = domain.get("grade", "N/A")
@@ -186,103 +521,84 @@ class AlertService:
             roi = domain.get("estimates", {}).get("roi_percent", 0)
             backlinks = domain.get("analysis", {}).get("backlink_count", 0)
 
-            rows += f"""
+            # Domain names come from scraped feeds, so they are HTML-escaped
+            rows.append(f"""
             <tr style="border-bottom: 1px solid #ddd;">
                 <td style="padding: 12px;">{i}</td>
-                <td style="padding: 12px;"><strong>{domain['domain']}</strong></td>
+                <td style="padding: 12px;"><strong>{escape(domain['domain'])}</strong></td>
                 <td style="padding: 12px; background: #f0f0f0; font-weight: bold;">{score:.1f} ({grade})</td>
                 <td style="padding: 12px;">${price_high:,}</td>
                 <td style="padding: 12px;">{roi:.0f}%</td>
                 <td style="padding: 12px;">{backlinks}</td>
             </tr>
-            """
-
-        html = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; color: #333; }}
-                .container {{ max-width: 900px; margin: 0 auto; padding: 20px; }}
-                h1 {{ color: #2196F3; }}
-                table {{ width: 100%; border-collapse: collapse; }}
-                th {{ background: #2196F3; color: white; padding: 12px; text-align: left; }}
-                .grade-a {{ color: #4CAF50; font-weight: bold; }}
-                .grade-b {{ color: #2196F3; font-weight: bold; }}
-                .grade-c {{ color: #FF9800; font-weight: bold; }}
-                .footer {{ margin-top: 30px; padding-top: 20px; border-top: 1px solid #ddd; font-size: 12px; color: #666; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>🎯 Domain Finder Pro - Daily Opportunities</h1>
-                <p>Hello,</p>
-                <p>Here are today's top {len(domains)} domain opportunities matching your criteria:</p>
-
-                <table>
-                    <thead>
-                        <tr>
-                            <th>#</th>
-                            <th>Domain</th>
-                            <th>Score</th>
-                            <th>Est. Value</th>
-                            <th>ROI</th>
-                            <th>Backlinks</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {rows}
-                    </tbody>
-                </table>
+            """)
 
-                <div class="footer">
-                    <p>💡 Scores are based on domain age, backlinks, authority, brandability, keywords, and traffic.</p>
-                    <p>© Domain Finder Pro - Your automated domain investment assistant</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        return html
+        return "".join((_EMAIL_HEADER, str(len(domains)), _EMAIL_TABLE_START, *rows, _EMAIL_FOOTER))
 
-    def send_slack_alert(self, webhook_url: str, domains: List[Dict]) -> bool:
+    async def send_slack_alert(
+        self, webhook_url: str, domains: List[Dict], payload: Optional[Dict] = None
+    ) -> bool:
         """Send Slack notification with top opportunities"""
         try:
-            # Build blocks for top 5 domains
-            blocks = [
-                {
-                    "type": "header",
-                    "text": {
-                        "type": "plain_text",
-                        "text": f"🎯 Top {len(domains)} Domain Opportunities",
-                    },
-                }
-            ]
+            if payload is None:
+                payload = self._build_slack_payload(domains)
+            return self._slack_accepted(await self._post_slack(webhook_url, payload))
+
+        except Exception as e:
+            logger.error(f"Slack send error: {e}")
+            return False
+
+    async def _post_slack(self, webhook_url: str, payload: Dict) -> httpx.Response:
+        """POST a Slack payload, paced per webhook; connection errors are raised"""
+        limiter = self.slack_limiters.get(webhook_url)
+        if limiter is None:
+            limiter = self.slack_limiters[webhook_url] = _TokenBucket(SLACK_RATE_LIMIT)
+        return await self._post(limiter, webhook_url, json=payload)
+
+    @staticmethod
+    def _slack_accepted(response: httpx.Response) -> bool:
+        """Whether Slack accepted the post, logging the outcome"""
+        if response.status_code == 200:
+            logger.info("Slack alert sent successfully")
+            return True
+        logger.error(f"Slack error: {response.text}")
+        return False
+
+    @staticmethod
+    def _build_slack_payload(domains: List[Dict]) -> Dict:
+        """Build Slack message blocks for the top 5 domains"""
+        blocks = [
+            {
+                "type": "header",
+                "text": {
+                    "type": "plain_text",
+                    "text": f"🎯 Top {len(domains)} Domain Opportunities",
+                },
+            }
+        ]
 
-            for domain in domains[:5]:
-                score = domain.get("score", {}).get("total_score", 0)
-                grade = domain.get("grade", "N/A")
-                price_high = domain.get("estimates", {}).get("price_high", 0)
-                roi = domain.get("estimates", {}).get("roi_percent", 0)
+        for domain in domains[:5]:
+            score = domain.get("score", {}).get("total_score", 0)
+            grade = domain.get("grade", "N/A")
+            price_high = domain.get("estimates", {}).get("price_high", 0)
+            roi = domain.get("estimates", {}).get("roi_percent", 0)
 
-                blocks.append({
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"*{domain['domain']}*\nScore: {score:.1f} (Grade {grade}) | Value: ${price_high:,} | ROI: {roi:.0f}%",
-                    },
-                })
+            blocks.append({
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": f"*{domain['domain']}*\nScore: {score:.1f} (Grade {grade}) | Value: ${price_high:,} | ROI: {roi:.0f}%",
+                },
+            })
 
-            payload = {"blocks": blocks}
+        return {"blocks": blocks}
 
-            response = httpx.post(webhook_url, json=payload, timeout=10.0)
+    async def aclose(self):
+        """Close HTTP session"""
+        await self.session.aclose()
 
-            if response.status_code == 200:
-                logger.info("Slack alert sent successfully")
-                return True
-            else:
-                logger.error(f"Slack error: {response.text}")
-                return False
+    async def __aenter__(self):
+        return self
 
-        except Exception as e:
-            logger.error(f"Slack send error: {e}")
-            return False
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
@@ -0,0 +1,67 @@
+"""
+Query Counter - Per-job SQL statement counts to catch N+1 regressions
+
+Jobs decorated with @count_queries("name") log how many statements they
+ran and which statement shapes ran most, e.g.
+
+    job=daily_scrape queries=4 top=[('INSERT INTO domains ...', 1), ...]
+
+Counting is scoped to the job's context, so concurrent requests and other
+jobs are not included; worker threads started with asyncio.to_thread
+inherit the job's counter.
+"""
+
+import functools
+import logging
+import re
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Statement shapes listed in each job summary
+TOP_PATTERNS = 5
+
+# Characters of each normalized statement kept as its pattern
+PATTERN_LENGTH = 80
+
+# Literal numbers and positional parameters ($1, ?) collapse to "?", so
+# statements differing only in their values count as one pattern
+_LITERALS = re.compile(r"\$?\b\d+\b")
+_WHITESPACE = re.compile(r"\s+")
+
+_active_counter: ContextVar[Optional[Counter]] = ContextVar("query_counter", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    counter = _active_counter.get()
+    if counter is not None:
+        pattern = _WHITESPACE.sub(" ", _LITERALS.sub("?", statement)).strip()
+        counter[pattern[:PATTERN_LENGTH]] += 1
+
+
+def count_queries(job_name: str):
+    """Decorator for async jobs that logs the statements each run executed"""
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            counter = Counter()
+            token = _active_counter.set(counter)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _active_counter.reset(token)
+                logger.info(
+                    f"job={job_name} queries={sum(counter.values())} "
+                    f"top={counter.most_common(TOP_PATTERNS)}"
+                )
+
+        return wrapper
+
+    return decorator
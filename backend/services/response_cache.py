@@ -0,0 +1,124 @@
+"""
+Response Cache - Short-lived in-process cache for read-mostly endpoints
+
+Domain listings only change when the daily scrape runs or a domain is
+added manually, so their JSON payloads are reused for a short TTL and
+dropped whenever the underlying data changes. Responses also carry
+ETag/Cache-Control headers so browsers and CDNs can revalidate cheaply.
+"""
+
+import functools
+import hashlib
+import inspect
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from fastapi import Request, Response
+from fastapi.responses import ORJSONResponse
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """Thread-safe TTL cache of encoded endpoint responses, keyed by (prefix, params)"""
+
+    def __init__(self, ttl: float = 60.0, maxsize: int = 512):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        with self._lock:
+            self._data[key] = (time.monotonic() + (ttl or self.ttl), value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, *prefixes: str):
+        """Drop cached responses for the given prefixes (all when none given)"""
+        with self._lock:
+            if not prefixes:
+                self._data.clear()
+                return
+            for key in [k for k in self._data if k[0] in prefixes]:
+                del self._data[key]
+
+
+response_cache = ResponseCache()
+
+
+def _cache_key(prefix: str, params: dict) -> Hashable:
+    """Cache key from an endpoint's parameters, excluding the `db` dependency"""
+    return (prefix, tuple(sorted(
+        (name, value) for name, value in params.items() if name != "db"
+    )))
+
+
+DEFAULT_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def etag_response(
+    cache_prefix: Optional[str] = None,
+    ttl: Optional[float] = None,
+    cache_control: str = DEFAULT_CACHE_CONTROL,
+):
+    """
+    Serve an async endpoint's payload as JSON with ETag and Cache-Control headers
+
+    The payload is encoded and hashed once; with a cache_prefix the encoded
+    body and its ETag are kept in response_cache by query parameters, so
+    cache hits skip the handler, the encoder and the hash entirely.
+    Answers 304 Not Modified when the client's If-None-Match already holds
+    the ETag. The wrapped endpoint does not take the request itself; it is
+    added to the signature FastAPI sees.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(request: Request, **kwargs):
+            key = _cache_key(cache_prefix, kwargs) if cache_prefix else None
+            encoded = response_cache.get(key) if key else None
+            if encoded is None:
+                body = ORJSONResponse(await func(**kwargs)).body
+                etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+                encoded = (body, etag)
+                if key:
+                    response_cache.set(key, encoded, ttl)
+
+            body, etag = encoded
+            headers = {"ETag": etag, "Cache-Control": cache_control}
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers=headers)
+            return Response(content=body, media_type="application/json", headers=headers)
+
+        signature = inspect.signature(func)
+        request_param = inspect.Parameter(
+            "request", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Request
+        )
+        wrapper.__signature__ = signature.replace(
+            parameters=[request_param, *signature.parameters.values()]
+        )
+        return wrapper
+    return decorator
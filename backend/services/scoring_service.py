@@ -10,16 +10,103 @@ Combines:
 
 import logging
 import asyncio
-from typing import Dict, Optional, List
-from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Optional, List, Tuple
+from datetime import datetime, timedelta
+from sqlalchemy import insert, select, tuple_
 from sqlalchemy.orm import Session
 
 from analyzers.domain_scorer import DomainScorer
 from analyzers.backlink_analyzer import BacklinkAnalyzer
+from database import upsert_insert
 import models
 
 logger = logging.getLogger(__name__)
 
+# Domains checked more recently than this reuse their stored analysis
+# instead of repeating the RDAP/Wayback/WHOIS lookups
+ANALYSIS_MAX_AGE = timedelta(hours=24)
+
+# DomainScorer breakdown fields stored in each DomainScore history row
+SCORE_HISTORY_FIELDS = (
+    "age_score",
+    "backlink_score",
+    "authority_score",
+    "brandability_score",
+    "keyword_score",
+    "traffic_score",
+    "total_score",
+)
+
+# Domain columns refreshed when a scored domain already exists
+DOMAIN_UPDATE_COLUMNS = (
+    "registered",
+    "backlink_count",
+    "domain_authority",
+    "domain_age_days",
+    "quality_score",
+    "price_estimate_low",
+    "price_estimate_high",
+    "roi_estimate",
+    "last_checked",
+    "updated_at",
+)
+
+
+@lru_cache(maxsize=None)
+def _domain_upsert_stmt(dialect_name: str):
+    """
+    Domain upsert returning (id, domain_name, tld), built once per dialect
+
+    Values arrive as bound parameters at execution, so every save reuses
+    the same statement object and its compiled SQL.
+    """
+    insert = upsert_insert(dialect_name)
+    stmt = insert(models.Domain)
+    return stmt.on_conflict_do_update(
+        index_elements=["domain_name", "tld"],
+        set_={column: stmt.excluded[column] for column in DOMAIN_UPDATE_COLUMNS},
+    ).returning(models.Domain.id, models.Domain.domain_name, models.Domain.tld)
+
+
+def load_recent_analyses(
+    db_session: Session, keys: List[Tuple[str, str]]
+) -> Dict[Tuple[str, str], Dict]:
+    """
+    Stored analysis of the given domains checked within ANALYSIS_MAX_AGE
+
+    Returns analyze_domain()-shaped dicts keyed by (domain_name, tld). The
+    analyzer's traffic data is always empty, so the stored metrics score
+    exactly as a fresh lookup would.
+    """
+    if not keys:
+        return {}
+
+    stored = db_session.execute(
+        select(
+            models.Domain.domain_name,
+            models.Domain.tld,
+            models.Domain.registered,
+            models.Domain.domain_age_days,
+            models.Domain.backlink_count,
+            models.Domain.domain_authority,
+        ).where(
+            tuple_(models.Domain.domain_name, models.Domain.tld).in_(set(keys)),
+            models.Domain.last_checked >= datetime.now() - ANALYSIS_MAX_AGE,
+        )
+    )
+    return {
+        (name, tld): {
+            "domain": f"{name}.{tld}",
+            "registered": registered,
+            "domain_age_days": age or 0,
+            "backlink_count": backlinks or 0,
+            "estimated_da": authority,
+            "traffic_data": {},
+        }
+        for name, tld, registered, age, backlinks, authority in stored
+    }
+
 
 class ScoringService:
     """Orchestrates domain analysis and scoring workflow"""
@@ -33,10 +120,15 @@ class ScoringService:
         domain_name: str,
         tld: str,
         db_session: Optional[Session] = None,
+        force_refresh: bool = False,
     ) -> Dict:
         """
         Complete domain analysis and scoring workflow
 
+        With a session, a domain checked within ANALYSIS_MAX_AGE is scored
+        from its stored metrics and not saved again, unless force_refresh
+        is set.
+
         Returns:
             {
                 "domain": "example.com",
@@ -51,7 +143,12 @@ class ScoringService:
 
         try:
             # Step 1: Analyze domain (backlinks, age, authority)
-            analysis = await self.backlink_analyzer.analyze_domain(full_domain)
+            analysis = None
+            if db_session and not force_refresh:
+                analysis = load_recent_analyses(db_session, [(domain_name, tld)]).get((domain_name, tld))
+            reused = analysis is not None
+            if not reused:
+                analysis = await self.backlink_analyzer.analyze_domain(full_domain)
             logger.debug(f"Analysis: {analysis}")
 
             # Step 2: Calculate score
@@ -65,13 +162,11 @@ class ScoringService:
             )
 
             # Step 3: Estimate price and ROI
-            price_low, price_high = DomainScorer.estimate_price(score_breakdown["total_score"])
-            roi = DomainScorer.estimate_roi(score_breakdown["total_score"])
-            grade = DomainScorer.get_grade(score_breakdown["total_score"])
+            grade, price_low, price_high, roi = DomainScorer.valuate(score_breakdown["total_score"])
 
             # Step 4: Save to database if session provided
             saved = False
-            if db_session:
+            if db_session and not reused:
                 saved = await self._save_domain_to_db(
                     db_session,
                     domain_name,
@@ -95,6 +190,7 @@ class ScoringService:
                     "backlink_count": analysis.get("backlink_count", 0),
                     "estimated_da": analysis.get("estimated_da", 0),
                     "wayback_snapshots": analysis.get("wayback_snapshots", 0),
+                    "wayback_snapshots_capped": analysis.get("wayback_snapshots_capped", False),
                     "first_seen": analysis.get("first_seen"),
                 },
                 "estimates": {
@@ -127,71 +223,120 @@ class ScoringService:
         price_high: float,
         roi: float,
     ) -> bool:
-        """Save or update domain in database"""
+        """
+        Save or update domain in database
+
+        One INSERT ... ON CONFLICT (domain_name, tld) DO UPDATE RETURNING id
+        writes the domain and yields the id for its score row, with no
+        check-then-write race; both are committed together. Use save_many
+        to write a batch of results at once.
+        """
         try:
-            # Check if domain exists
-            existing = db_session.query(models.Domain).filter(
-                models.Domain.domain_name == domain_name,
-                models.Domain.tld == tld,
-            ).first()
-
-            if existing:
-                # Update existing domain
-                existing.registered = analysis.get("registered", False)
-                existing.backlink_count = analysis.get("backlink_count", 0)
-                existing.domain_authority = analysis.get("estimated_da")
-                existing.domain_age_days = analysis.get("domain_age_days", 0)
-                existing.quality_score = score_breakdown["total_score"]
-                existing.price_estimate_low = price_low
-                existing.price_estimate_high = price_high
-                existing.roi_estimate = roi
-                existing.last_checked = datetime.now()
-            else:
-                # Create new domain
-                domain_obj = models.Domain(
-                    domain_name=domain_name,
-                    tld=tld,
-                    registered=analysis.get("registered", False),
-                    backlink_count=analysis.get("backlink_count", 0),
-                    domain_authority=analysis.get("estimated_da"),
-                    domain_age_days=analysis.get("domain_age_days", 0),
-                    quality_score=score_breakdown["total_score"],
-                    price_estimate_low=price_low,
-                    price_estimate_high=price_high,
-                    roi_estimate=roi,
-                    last_checked=datetime.now(),
-                )
-                db_session.add(domain_obj)
-
-            # Also save score breakdown to DomainScore table
-            domain_score = models.DomainScore(
-                domain_id=existing.id if existing else None,  # Will be set after flush
-                age_score=score_breakdown["age_score"],
-                backlink_score=score_breakdown["backlink_score"],
-                authority_score=score_breakdown["authority_score"],
-                brandability_score=score_breakdown["brandability_score"],
-                keyword_score=score_breakdown["keyword_score"],
-                traffic_score=score_breakdown["traffic_score"],
-                total_score=score_breakdown["total_score"],
-                calculated_at=datetime.now(),
+            self._write_scored_domains(db_session, [
+                self._domain_row(domain_name, tld, analysis, score_breakdown, price_low, price_high, roi)
+            ])
+            return True
+
+        except Exception as e:
+            logger.error(f"Database save error: {e}")
+            db_session.rollback()
+            return False
+
+    async def save_many(self, db_session: Session, results: List[Dict]) -> int:
+        """
+        Save many analyze_and_score_domain() results in one transaction
+
+        Failed results (which carry only an error) are skipped, and a later
+        result for the same domain replaces an earlier one. Returns the
+        number of domains saved.
+        """
+        rows = {}
+        for result in results:
+            if "score" not in result:
+                continue
+            analysis = result["analysis"]
+            estimates = result["estimates"]
+            rows[(result["domain_name"], result["tld"])] = self._domain_row(
+                result["domain_name"],
+                result["tld"],
+                analysis,
+                result["score"],
+                estimates["price_low"],
+                estimates["price_high"],
+                estimates["roi_percent"],
             )
 
-            db_session.add(domain_score)
-            db_session.commit()
+        if not rows:
+            return 0
 
-            return True
+        try:
+            self._write_scored_domains(db_session, list(rows.values()))
+            return len(rows)
 
         except Exception as e:
             logger.error(f"Database save error: {e}")
             db_session.rollback()
-            return False
+            return 0
+
+    @staticmethod
+    def _domain_row(
+        domain_name: str,
+        tld: str,
+        analysis: Dict,
+        score_breakdown: Dict,
+        price_low: float,
+        price_high: float,
+        roi: float,
+    ) -> Tuple[Dict, Dict]:
+        """Domain upsert parameters and score breakdown for one scored domain"""
+        now = datetime.now()
+        return {
+            "domain_name": domain_name,
+            "tld": tld,
+            "registered": analysis.get("registered", False),
+            "backlink_count": analysis.get("backlink_count", 0),
+            "domain_authority": analysis.get("estimated_da"),
+            "domain_age_days": analysis.get("domain_age_days", 0),
+            "quality_score": score_breakdown["total_score"],
+            "price_estimate_low": price_low,
+            "price_estimate_high": price_high,
+            "roi_estimate": roi,
+            "last_checked": now,
+            "updated_at": now,
+        }, score_breakdown
+
+    @staticmethod
+    def _write_scored_domains(db_session: Session, rows: List[Tuple[Dict, Dict]]):
+        """
+        Upsert domains and insert their score breakdowns, then commit
+
+        Both are executemany statements with bound parameters, so no ORM
+        instance is created per row; the upsert returns each domain's id
+        for its score row.
+        """
+        written = db_session.execute(
+            _domain_upsert_stmt(db_session.bind.dialect.name),
+            [domain for domain, _ in rows],
+        )
+        domain_ids = {(name, tld): domain_id for domain_id, name, tld in written}
+
+        calculated_at = datetime.now()
+        db_session.execute(insert(models.DomainScore), [
+            {
+                "domain_id": domain_ids[(domain["domain_name"], domain["tld"])],
+                **{field: breakdown[field] for field in SCORE_HISTORY_FIELDS},
+                "calculated_at": calculated_at,
+            }
+            for domain, breakdown in rows
+        ])
+        db_session.commit()
 
-    def close(self):
+    async def aclose(self):
         """Close analyzer resources"""
-        self.backlink_analyzer.session.close()
+        await self.backlink_analyzer.aclose()
 
-    def __enter__(self):
+    async def __aenter__(self):
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
@@ -0,0 +1,118 @@
+"""
+Alert Worker - Delivers subscriber alerts off the scrape job's critical path
+
+The daily scrape publishes a "top domains ready" event once its results are
+stored; this worker consumes events from an in-process queue and runs
+AlertService.send_daily_alerts for each, so a slow SendGrid or Slack
+response never holds up scraping. A run whose deliveries all failed for
+transient reasons is retried with backoff from the queued event, without
+re-running the scrape, and per-delivery errors are kept in a bounded
+dead-letter list.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy.orm import sessionmaker
+
+logger = logging.getLogger(__name__)
+
+# Events waiting for delivery; the scrape runs daily, so a full queue means
+# the worker is stuck
+ALERT_QUEUE_SIZE = 8
+
+# Attempts per event before its errors are dead-lettered
+ALERT_MAX_ATTEMPTS = 3
+
+# Delay before the first retry (seconds), doubled for each later one
+ALERT_RETRY_DELAY = 30.0
+
+# Failed deliveries kept for inspection
+DEAD_LETTER_SIZE = 100
+
+
+class AlertWorker:
+    """Consumes "top domains ready" events and dispatches subscriber alerts"""
+
+    def __init__(self, session_maker: Optional[sessionmaker] = None):
+        self.session_maker = session_maker
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=ALERT_QUEUE_SIZE)
+        self.dead_letters: deque = deque(maxlen=DEAD_LETTER_SIZE)
+        self.alert_service = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start consuming events; must be called from the running event loop"""
+        from services.alert_service import AlertService
+
+        if self._task is not None:
+            return
+        self.alert_service = AlertService()
+        self._task = asyncio.create_task(self._consume())
+        logger.info("Alert worker started")
+
+    async def stop(self):
+        """Stop consuming and close the alert service's HTTP client"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.alert_service is not None:
+            await self.alert_service.aclose()
+            self.alert_service = None
+        logger.info("Alert worker stopped")
+
+    def publish(self, top_domains: List[Dict]) -> bool:
+        """Queue a top-domains event for delivery; returns False if it was dropped"""
+        if not top_domains:
+            return False
+        try:
+            self.queue.put_nowait(top_domains)
+            return True
+        except asyncio.QueueFull:
+            logger.warning(f"Alert queue full, dropping event with {len(top_domains)} domains")
+            return False
+
+    async def _consume(self):
+        """Deliver queued events one at a time"""
+        while True:
+            top_domains = await self.queue.get()
+            try:
+                await self._dispatch(top_domains)
+            except Exception as e:
+                logger.error(f"Alert worker error: {e}", exc_info=True)
+            finally:
+                self.queue.task_done()
+
+    async def _dispatch(self, top_domains: List[Dict]) -> Dict:
+        """Send one event's alerts, retrying runs where nothing was delivered for transient reasons"""
+        delay = ALERT_RETRY_DELAY
+        for attempt in range(1, ALERT_MAX_ATTEMPTS + 1):
+            with self.session_maker() as db_session:
+                results = await self.alert_service.send_daily_alerts(db_session, top_domains)
+
+            # Only transient failures (connection errors, 429, 5xx) are
+            # retried; unconfigured channels and rejected sends won't change
+            delivered = results["email_sent"] + results["slack_sent"]
+            if not results["retryable"] or delivered or attempt == ALERT_MAX_ATTEMPTS:
+                break
+
+            logger.warning(
+                f"Alert run failed (attempt {attempt}/{ALERT_MAX_ATTEMPTS}), "
+                f"retrying in {delay:.0f}s: {results['errors']}"
+            )
+            await asyncio.sleep(delay)
+            delay *= 2
+
+        if results["errors"]:
+            self.dead_letters.append({
+                "failed_at": datetime.now(),
+                "domain_count": len(top_domains),
+                "errors": results["errors"],
+            })
+        return results
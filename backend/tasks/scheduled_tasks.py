@@ -6,32 +6,66 @@ Runs at 9 AM UTC daily to:
 2. Analyze each domain (backlinks, age, authority)
 3. Calculate quality scores
 4. Update database
-5. Send alerts to subscribers
+5. Publish the results to the alert worker, which notifies subscribers
 """
 
+import asyncio
 import logging
+import os
 from datetime import datetime, timedelta
-from typing import Optional
-from apscheduler.schedulers.background import BackgroundScheduler
-from sqlalchemy.orm import Session
+from typing import Dict, List, Optional, Tuple
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from sqlalchemy import delete, select
+from sqlalchemy.orm import sessionmaker
+
+from services.query_counter import count_queries
+from services.scoring_service import ScoringService
 
 logger = logging.getLogger(__name__)
 
+# Domains analyzed at once by the daily scrape (RDAP/Wayback/WHOIS lookups)
+ANALYSIS_CONCURRENCY = 20
+
 
 class TaskScheduler:
-    """Manages scheduled tasks using APScheduler"""
+    """
+    Manages scheduled tasks using APScheduler
+
+    Jobs run on the application's event loop: the daily scrape is awaited as
+    a coroutine, and one BacklinkAnalyzer (and its pooled HTTP client) is
+    shared by every run until the scheduler stops. Subscriber alerts are
+    handed to an AlertWorker rather than sent by the scrape itself.
+    """
 
     def __init__(self):
-        self.scheduler = BackgroundScheduler()
+        self.scheduler = AsyncIOScheduler()
+        self.analyzer = None
+        self.alert_worker = None
         self.is_running = False
 
-    def start(self, db_session: Optional[Session] = None):
-        """Start the scheduler"""
+    def start(self, session_maker: Optional[sessionmaker] = None):
+        """
+        Start the scheduler
+
+        Must be called from the running event loop. Jobs get the
+        sessionmaker rather than a session and open a fresh one per run, so
+        no connection or identity map is held between runs
+        """
+        from analyzers.backlink_analyzer import BacklinkAnalyzer
+        from tasks.alert_worker import AlertWorker
+
         if self.is_running:
             logger.warning("Scheduler already running")
             return
 
         try:
+            self.analyzer = BacklinkAnalyzer(
+                os.getenv("WHOIS_JSON_API_KEY"), concurrency=ANALYSIS_CONCURRENCY
+            )
+            if session_maker:
+                self.alert_worker = AlertWorker(session_maker)
+                self.alert_worker.start()
+
             # Daily domain scraping at 9 AM UTC
             self.scheduler.add_job(
                 self.daily_scrape_job,
@@ -41,7 +75,7 @@ class TaskScheduler:
                 timezone="UTC",
                 id="daily_scrape",
                 name="Daily domain scrape at 9 AM UTC",
-                args=[db_session],
+                args=[session_maker, self.analyzer, self.alert_worker],
             )
 
             # Cleanup old data weekly
@@ -54,7 +88,7 @@ class TaskScheduler:
                 timezone="UTC",
                 id="cleanup",
                 name="Weekly cleanup of old domain records",
-                args=[db_session],
+                args=[session_maker],
             )
 
             self.scheduler.start()
@@ -65,26 +99,41 @@ class TaskScheduler:
             logger.error(f"Error starting scheduler: {e}")
             raise
 
-    def stop(self):
-        """Stop the scheduler"""
+    async def stop(self):
+        """Stop the scheduler, the alert worker and the shared analyzer"""
         if self.is_running and self.scheduler.running:
             self.scheduler.shutdown()
             self.is_running = False
             logger.info("Task scheduler stopped")
+        if self.alert_worker is not None:
+            await self.alert_worker.stop()
+            self.alert_worker = None
+        if self.analyzer is not None:
+            await self.analyzer.aclose()
+            self.analyzer = None
 
     @staticmethod
-    def daily_scrape_job(db_session: Optional[Session] = None):
+    @count_queries("daily_scrape")
+    async def daily_scrape_job(
+        session_maker: Optional[sessionmaker] = None,
+        analyzer=None,
+        alert_worker=None,
+        force_refresh: bool = False,
+    ):
         """
         Daily job to scrape, analyze, and score domains
 
-        This is called at 9 AM UTC every day
+        This is called at 9 AM UTC every day. Pass a BacklinkAnalyzer to
+        reuse its client and lookup caches; otherwise one is opened for
+        this run only. With an AlertWorker, the scored domains are
+        published to it for subscriber alerts once they are stored.
+
+        Domains analyzed within ANALYSIS_MAX_AGE are scored from their stored
+        metrics and left as stored, unless force_refresh is set.
         """
-        import os
         from scrapers.expireddomains_scraper import ExpiredDomainsScraper, LocalDomainListScraper
         from analyzers.domain_scorer import DomainScorer
         from analyzers.backlink_analyzer import BacklinkAnalyzer
-        import models
-        import asyncio
 
         logger.info("=" * 80)
         logger.info("STARTING DAILY DOMAIN SCRAPE JOB")
@@ -99,14 +148,16 @@ class TaskScheduler:
 
             if use_sample:
                 logger.info("Using sample domains (Apify token not configured)")
-                domains_data = asyncio.run(LocalDomainListScraper.scrape_sample_domains(limit=20))
+                domains_data = [
+                    domain_data
+                    async for domain_data in LocalDomainListScraper.scrape_sample_domains(limit=20)
+                ]
             else:
                 logger.info("Using Apify scraper to fetch real domains")
-                scraper = ExpiredDomainsScraper(apify_token)
-                domains_data = asyncio.run(
-                    scraper.scrape_expired_domains(limit=50, sort_by="price", sort_order="asc")
-                )
-                scraper.close()
+                async with ExpiredDomainsScraper(apify_token) as scraper:
+                    domains_data = await scraper.scrape_expired_domains(
+                        limit=50, sort_by="price", sort_order="asc"
+                    )
 
             if not domains_data:
                 logger.warning("No domains scraped")
@@ -114,27 +165,48 @@ class TaskScheduler:
 
             logger.info(f"Scraped {len(domains_data)} domains")
 
-            # Initialize analyzers
-            whois_api_key = os.getenv("WHOIS_JSON_API_KEY")
-            backlink_analyzer = BacklinkAnalyzer(whois_api_key)
+            targets = []
+            for domain_data in domains_data:
+                if not domain_data.get("domain_name", ""):
+                    logger.warning(f"Skipping domain with no name: {domain_data}")
+                    continue
+                targets.append(domain_data)
+
+            keys = [
+                (domain_data["domain_name"], domain_data.get("tld", "com"))
+                for domain_data in targets
+            ]
+            recent = {}
+            if session_maker and not force_refresh:
+                recent = await asyncio.to_thread(_load_recent_analyses, session_maker, keys)
+                if recent:
+                    logger.info(f"Reusing stored analysis for {len(recent)} recently checked domains")
+
+            # Analyze domains (backlinks, age, authority), ANALYSIS_CONCURRENCY at a time
+            full_domains = [f"{name}.{tld}" for name, tld in keys if (name, tld) not in recent]
+            fetched = []
+            if full_domains:
+                logger.info(f"Analyzing {len(full_domains)} domains...")
+                if analyzer is not None:
+                    fetched = await analyzer.analyze_domains(
+                        full_domains, concurrency=ANALYSIS_CONCURRENCY
+                    )
+                else:
+                    async with BacklinkAnalyzer(os.getenv("WHOIS_JSON_API_KEY")) as run_analyzer:
+                        fetched = await run_analyzer.analyze_domains(
+                            full_domains, concurrency=ANALYSIS_CONCURRENCY
+                        )
+            fetched = iter(fetched)
+            analyses = [recent.get(key) or next(fetched) for key in keys]
 
             # Process each domain
-            processed_count = 0
-            for domain_data in domains_data:
+            rows = {}
+            top_domains = {}
+            for domain_data, analysis in zip(targets, analyses):
                 try:
                     domain_name = domain_data.get("domain_name", "")
                     tld = domain_data.get("tld", "com")
 
-                    if not domain_name:
-                        logger.warning(f"Skipping domain with no name: {domain_data}")
-                        continue
-
-                    # Analyze domain
-                    logger.info(f"Analyzing {domain_name}.{tld}...")
-                    analysis = asyncio.run(
-                        backlink_analyzer.analyze_domain(f"{domain_name}.{tld}")
-                    )
-
                     # Calculate score
                     score_breakdown = DomainScorer.calculate_score(
                         domain_name=domain_name,
@@ -146,46 +218,30 @@ class TaskScheduler:
                     )
 
                     # Estimate price
-                    price_low, price_high = DomainScorer.estimate_price(score_breakdown["total_score"])
-
-                    # Store or update in database
-                    if db_session:
-                        existing = db_session.query(models.Domain).filter(
-                            models.Domain.domain_name == domain_name,
-                            models.Domain.tld == tld,
-                        ).first()
-
-                        if existing:
-                            # Update existing
-                            existing.backlink_count = analysis.get("backlink_count", 0)
-                            existing.domain_authority = analysis.get("estimated_da")
-                            existing.domain_age_days = analysis.get("domain_age_days", 0)
-                            existing.quality_score = score_breakdown["total_score"]
-                            existing.price_estimate_low = price_low
-                            existing.price_estimate_high = price_high
-                            existing.roi_estimate = DomainScorer.estimate_roi(
-                                score_breakdown["total_score"]
-                            )
-                            existing.registered = analysis.get("registered", False)
-                            existing.last_checked = datetime.now()
-                        else:
-                            # Create new
-                            domain_obj = models.Domain(
-                                domain_name=domain_name,
-                                tld=tld,
-                                registered=analysis.get("registered", False),
-                                backlink_count=analysis.get("backlink_count", 0),
-                                domain_authority=analysis.get("estimated_da"),
-                                domain_age_days=analysis.get("domain_age_days", 0),
-                                quality_score=score_breakdown["total_score"],
-                                price_estimate_low=price_low,
-                                price_estimate_high=price_high,
-                                roi_estimate=DomainScorer.estimate_roi(score_breakdown["total_score"]),
-                                last_checked=datetime.now(),
-                            )
-                            db_session.add(domain_obj)
-
-                        processed_count += 1
+                    grade, price_low, price_high, roi = DomainScorer.valuate(
+                        score_breakdown["total_score"]
+                    )
+
+                    # Collected for a single upsert below; a later duplicate
+                    # of the same domain replaces the earlier one. Reused
+                    # analyses are already stored, so only alerts see them
+                    if (domain_name, tld) not in recent:
+                        rows[(domain_name, tld)] = ScoringService._domain_row(
+                            domain_name, tld, analysis, score_breakdown, price_low, price_high, roi
+                        )
+                    top_domains[(domain_name, tld)] = {
+                        "domain": f"{domain_name}.{tld}",
+                        "score": score_breakdown,
+                        "grade": grade,
+                        "analysis": {
+                            "domain_age_days": analysis.get("domain_age_days", 0),
+                            "backlink_count": analysis.get("backlink_count", 0),
+                        },
+                        "estimates": {
+                            "price_high": price_high,
+                            "roi_percent": roi,
+                        },
+                    }
 
                     logger.info(
                         f"✓ {domain_name}.{tld}: Score={score_breakdown['total_score']:.1f}, "
@@ -197,14 +253,15 @@ class TaskScheduler:
                     logger.error(f"Error processing domain {domain_data.get('domain_name', 'unknown')}: {e}")
                     continue
 
-            # Commit all changes
-            if db_session:
-                try:
-                    db_session.commit()
-                    logger.info(f"Successfully processed and stored {processed_count} domains")
-                except Exception as e:
-                    logger.error(f"Database commit error: {e}")
-                    db_session.rollback()
+            # The sync session's blocking writes run in a worker thread so
+            # the event loop keeps serving requests meanwhile
+            if session_maker and rows:
+                await asyncio.to_thread(store_scrape_results, session_maker, list(rows.values()))
+
+            # Alerts are delivered by the worker, so slow email/Slack
+            # endpoints never hold up the job
+            if alert_worker is not None and alert_worker.publish(list(top_domains.values())):
+                logger.info(f"Published {len(top_domains)} domains for alerting")
 
             logger.info("=" * 80)
             logger.info("DAILY SCRAPE JOB COMPLETED SUCCESSFULLY")
@@ -213,41 +270,46 @@ class TaskScheduler:
         except Exception as e:
             logger.error(f"Daily scrape job failed: {e}", exc_info=True)
 
-        finally:
-            backlink_analyzer.session.close()
-
     @staticmethod
-    def cleanup_old_data_job(db_session: Optional[Session] = None):
+    def cleanup_old_data_job(session_maker: Optional[sessionmaker] = None):
         """
         Weekly cleanup job to remove old domain records
 
         Keeps domains from last 7 days to avoid data staleness
         """
+        from services.response_cache import response_cache
         import models
 
         logger.info("Starting cleanup of old domain records...")
 
-        try:
-            if not db_session:
-                logger.warning("No database session for cleanup")
-                return
-
-            # Delete domains not checked in 30 days
-            cutoff_date = datetime.now() - timedelta(days=30)
-            old_domains = db_session.query(models.Domain).filter(
-                models.Domain.last_checked < cutoff_date
-            ).all()
+        if not session_maker:
+            logger.warning("No database session for cleanup")
+            return
 
-            deleted_count = len(old_domains)
-            for domain in old_domains:
-                db_session.delete(domain)
+        with session_maker() as db_session:
+            try:
+                # Delete domains not checked in 30 days with set-based DELETEs;
+                # their portfolio items (the ORM delete-orphan cascade) and score
+                # history go first so no foreign key is left dangling
+                cutoff_date = datetime.now() - timedelta(days=30)
+                stale_ids = select(models.Domain.id).where(
+                    models.Domain.last_checked < cutoff_date
+                ).scalar_subquery()
+
+                for dependent in (models.PortfolioItem, models.DomainScore):
+                    db_session.execute(
+                        delete(dependent).where(dependent.domain_id.in_(stale_ids))
+                    )
+                deleted_count = db_session.execute(
+                    delete(models.Domain).where(models.Domain.last_checked < cutoff_date)
+                ).rowcount
 
-            db_session.commit()
-            logger.info(f"Cleaned up {deleted_count} old domain records")
+                db_session.commit()
+                response_cache.invalidate("top", "list")
+                logger.info(f"Cleaned up {deleted_count} old domain records")
 
-        except Exception as e:
-            logger.error(f"Cleanup job failed: {e}", exc_info=True)
-            if db_session:
+            except Exception as e:
+                logger.error(f"Cleanup job failed: {e}", exc_info=True)
                 db_session.rollback()
 
 
@@ -263,13 +325,41 @@ def get_scheduler() -> TaskScheduler:
     return _scheduler_instance
 
 
-def start_scheduler(db_session: Optional[Session] = None):
+def start_scheduler(session_maker: Optional[sessionmaker] = None):
     """Start the global scheduler"""
     scheduler = get_scheduler()
-    scheduler.start(db_session)
+    scheduler.start(session_maker)
 
 
-def stop_scheduler():
+async def stop_scheduler():
     """Stop the global scheduler"""
     scheduler = get_scheduler()
-    scheduler.stop()
+    await scheduler.stop()
+
+
+def _load_recent_analyses(
+    session_maker: sessionmaker, keys: List[Tuple[str, str]]
+) -> Dict[Tuple[str, str], Dict]:
+    """Stored analyses of recently checked domains, on a session of its own"""
+    from services.scoring_service import load_recent_analyses
+
+    with session_maker() as db_session:
+        return load_recent_analyses(db_session, keys)
+
+
+def store_scrape_results(session_maker: sessionmaker, rows: List[Tuple[Dict, Dict]]):
+    """
+    Upsert a scrape run's domains and record their score breakdowns in one transaction
+
+    rows are ScoringService._domain_row() results, unique by (domain_name, tld)
+    """
+    from services.response_cache import response_cache
+
+    with session_maker() as db_session:
+        try:
+            ScoringService._write_scored_domains(db_session, rows)
+            response_cache.invalidate("top", "list")
+            logger.info(f"Successfully processed and stored {len(rows)} domains")
+        except Exception as e:
+            logger.error(f"Database commit error: {e}")
+            db_session.rollback()
@@ -6,17 +6,74 @@ Run with: python test_week2.py
 
 import logging
 import asyncio
+import time
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Dict, Optional
 from analyzers.domain_scorer import DomainScorer
 from analyzers.backlink_analyzer import BacklinkAnalyzer
 from scrapers.expireddomains_scraper import LocalDomainListScraper
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# uvloop ships with uvicorn[standard] on Linux/macOS; main() runs the async
+# tests on it when available. uvloop.run leaves the global event loop policy
+# alone, so importing this module doesn't change other tests' loops
+try:
+    from uvloop import run as run_event_loop
+except ImportError:
+    run_event_loop = asyncio.run
+
+
+class SecondCachedFormatter(logging.Formatter):
+    """Formatter that renders the date and time once per second
+
+    Records logged within the same second reuse the cached text and only
+    append their milliseconds, matching logging.Formatter's default output.
+    """
+
+    _cached = (-1, "")
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached_second, stamp = self._cached
+        if second != cached_second:
+            stamp = time.strftime(datefmt or self.default_time_format, self.converter(second))
+            self._cached = (second, stamp)
+        if datefmt:
+            return stamp
+        return self.default_msec_format % (stamp, record.msecs)
+
+
 logger = logging.getLogger(__name__)
 
+# Fields the integration check scores; every LocalDomainListScraper sample
+# domain carries all of them
+_scored_fields = itemgetter("domain_name", "tld", "domain_age_days", "backlink_count")
+
+# Keep-alive connections in the HTTP pool shared by the async tests
+SHARED_POOL_SIZE = 100
+
+
+@dataclass(frozen=True, slots=True)
+class ScoreCase:
+    """Domain scorer fixture"""
+    name: str
+    tld: str
+    age_days: int
+    backlinks: int
+    authority: int
+    traffic: Optional[Dict]
+
+
+# Built once at import and shared by every run of the scorer test
+TEST_CASES = (
+    ScoreCase("techstartup", "com", age_days=2920, backlinks=45, authority=35,  # 8 years
+              traffic={"monthly_visitors": 5000}),
+    ScoreCase("aitools", "io", age_days=1095, backlinks=78, authority=42,  # 3 years
+              traffic={"monthly_visitors": 15000}),
+    ScoreCase("newdomain", "app", age_days=30, backlinks=0, authority=0,  # 1 month
+              traffic=None),
+)
+
 
 def test_domain_scorer():
     """Test the domain scoring algorithm"""
@@ -24,87 +81,81 @@ def test_domain_scorer():
     logger.info("TEST 1: Domain Scorer")
     logger.info("="*80)
 
-    test_cases = [
-        {
-            "name": "techstartup",
-            "tld": "com",
-            "age_days": 2920,  # 8 years
-            "backlinks": 45,
-            "authority": 35,
-            "traffic": {"monthly_visitors": 5000},
-        },
-        {
-            "name": "aitools",
-            "tld": "io",
-            "age_days": 1095,  # 3 years
-            "backlinks": 78,
-            "authority": 42,
-            "traffic": {"monthly_visitors": 15000},
-        },
+    # Score every case in one column-wise batch call, then report each
+    scores = DomainScorer.calculate_score_batch([
         {
-            "name": "newdomain",
-            "tld": "app",
-            "age_days": 30,  # 1 month
-            "backlinks": 0,
-            "authority": 0,
-            "traffic": None,
-        },
-    ]
-
-    for test in test_cases:
-        logger.info(f"\nScoring {test['name']}.{test['tld']}...")
-        score = DomainScorer.calculate_score(
-            domain_name=test["name"],
-            tld=test["tld"],
-            age_days=test["age_days"],
-            backlink_count=test["backlinks"],
-            domain_authority=test["authority"],
-            traffic_json=test["traffic"],
-        )
-
-        price_low, price_high = DomainScorer.estimate_price(score["total_score"])
-        grade = DomainScorer.get_grade(score["total_score"])
-        roi = DomainScorer.estimate_roi(score["total_score"])
-
-        logger.info(f"  Score: {score['total_score']:.1f}/100")
-        logger.info(f"  Grade: {grade}")
-        logger.info(f"  Est. Value: ${price_low:,} - ${price_high:,}")
-        logger.info(f"  ROI Potential: {roi:.0f}%")
-        logger.info(f"  Breakdown:")
-        logger.info(f"    - Age: {score['age_score']:.1f}")
-        logger.info(f"    - Backlinks: {score['backlink_score']:.1f}")
-        logger.info(f"    - Authority: {score['authority_score']:.1f}")
-        logger.info(f"    - Brandability: {score['brandability_score']:.1f}")
-        logger.info(f"    - Keywords: {score['keyword_score']:.1f}")
-        logger.info(f"    - Traffic: {score['traffic_score']:.1f}")
-
-
-async def test_backlink_analyzer():
-    """Test the backlink analyzer"""
+            "domain_name": test.name,
+            "tld": test.tld,
+            "age_days": test.age_days,
+            "backlink_count": test.backlinks,
+            "domain_authority": test.authority,
+            "traffic_json": test.traffic,
+        }
+        for test in TEST_CASES
+    ])
+
+    # The reports are all that's left to do; skip building them when INFO
+    # output is off
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    for test, score in zip(TEST_CASES, scores):
+        grade, price_low, price_high, roi = DomainScorer.valuate(score["total_score"])
+
+        # One record per domain: a single lock/format/write, and reports
+        # from concurrent checks don't interleave line by line
+        logger.info("\n".join([
+            f"\nScoring {test.name}.{test.tld}...",
+            f"  Score: {score['total_score']:.1f}/100",
+            f"  Grade: {grade}",
+            f"  Est. Value: ${price_low:,} - ${price_high:,}",
+            f"  ROI Potential: {roi:.0f}%",
+            f"  Breakdown:",
+            f"    - Age: {score['age_score']:.1f}",
+            f"    - Backlinks: {score['backlink_score']:.1f}",
+            f"    - Authority: {score['authority_score']:.1f}",
+            f"    - Brandability: {score['brandability_score']:.1f}",
+            f"    - Keywords: {score['keyword_score']:.1f}",
+            f"    - Traffic: {score['traffic_score']:.1f}",
+        ]))
+
+
+async def test_backlink_analyzer(session=None):
+    """Test the backlink analyzer, optionally over a shared HTTP client"""
     logger.info("\n" + "="*80)
     logger.info("TEST 2: Backlink Analyzer")
     logger.info("="*80)
 
-    analyzer = BacklinkAnalyzer()
-
     # Test with a known domain
     test_domains = ["google.com", "github.com", "wikipedia.org"]
 
-    for domain in test_domains:
-        logger.info(f"\nAnalyzing {domain}...")
-        try:
-            result = await analyzer.analyze_domain(domain)
-            logger.info(f"  Registered: {result['registered']}")
-            logger.info(f"  Age (days): {result['domain_age_days']}")
-            logger.info(f"  Backlinks: {result['backlink_count']}")
-            logger.info(f"  Est. DA: {result['estimated_da']}")
-            logger.info(f"  Wayback Snapshots: {result['wayback_snapshots']}")
-            if result.get('first_seen'):
-                logger.info(f"  First Seen: {result['first_seen']}")
-        except Exception as e:
-            logger.error(f"  Error: {e}")
+    # All domains are analyzed at once over the analyzer's pooled client
+    async with BacklinkAnalyzer(session=session) as analyzer:
+        results = await asyncio.gather(
+            *(analyzer.analyze_domain(domain) for domain in test_domains),
+            return_exceptions=True,
+        )
 
-    analyzer.session.close()
+        for domain, result in zip(test_domains, results):
+            try:
+                if isinstance(result, Exception):
+                    raise result
+                if not logger.isEnabledFor(logging.INFO):
+                    continue
+                lines = [
+                    f"\nResults for {domain}:",
+                    f"  Registered: {result['registered']}",
+                    f"  Age (days): {result['domain_age_days']}",
+                    f"  Backlinks: {result['backlink_count']}",
+                    f"  Est. DA: {result['estimated_da']}",
+                    f"  Wayback Snapshots: {result['wayback_snapshots']}"
+                    f"{'+' if result['wayback_snapshots_capped'] else ''}",
+                ]
+                if result.get('first_seen'):
+                    lines.append(f"  First Seen: {result['first_seen']}")
+                logger.info("\n".join(lines))
+            except Exception as e:
+                logger.error(f"\nResults for {domain}:\n  Error: {e}")
 
 
 async def test_expired_domains_scraper():
@@ -113,57 +164,103 @@ async def test_expired_domains_scraper():
     logger.info("TEST 3: Expired Domains Scraper (Sample Data)")
     logger.info("="*80)
 
-    domains = await LocalDomainListScraper.scrape_sample_domains(limit=5)
+    count = 0
+    async for domain in LocalDomainListScraper.scrape_sample_domains(limit=5):
+        count += 1
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n".join([
+                f"  {domain['domain_name']}.{domain['tld']}",
+                f"    - Price: ${domain.get('price', 'N/A')}",
+                f"    - Age: {domain.get('domain_age_days', 0)} days",
+                f"    - Backlinks: {domain.get('backlink_count', 0)}",
+            ]))
 
-    logger.info(f"Scraped {len(domains)} sample domains:\n")
+    logger.info(f"Scraped {count} sample domains\n")
 
-    for domain in domains:
-        logger.info(f"  {domain['domain_name']}.{domain['tld']}")
-        logger.info(f"    - Price: ${domain.get('price', 'N/A')}")
-        logger.info(f"    - Age: {domain.get('domain_age_days', 0)} days")
-        logger.info(f"    - Backlinks: {domain.get('backlink_count', 0)}")
 
+async def _process_domain(domain_data: Dict):
+    """Score one scraped domain and log the result"""
+    domain_name, tld, age_days, backlink_count = _scored_fields(domain_data)
 
-def test_integration():
-    """Test integrated workflow: scrape -> analyze -> score"""
-    logger.info("\n" + "="*80)
-    logger.info("TEST 4: Integration Test (Scrape -> Analyze -> Score)")
-    logger.info("="*80)
+    # Score domain
+    score = DomainScorer.calculate_score(
+        domain_name=domain_name,
+        tld=tld,
+        age_days=age_days,
+        backlink_count=backlink_count,
+    )
+
+    if not logger.isEnabledFor(logging.INFO):
+        return
 
-    async def integrated_workflow():
-        # Scrape sample domains
-        logger.info("Step 1: Scraping domains...")
-        domains = await LocalDomainListScraper.scrape_sample_domains(limit=3)
+    grade, price_low, price_high, _ = DomainScorer.valuate(score["total_score"])
 
-        # Analyze and score each
-        logger.info("Step 2: Analyzing and scoring domains...\n")
+    logger.info("\n".join([
+        f"Processing {domain_name}.{tld}...",
+        f"  ✓ Score: {score['total_score']:.1f} (Grade {grade})",
+        f"  ✓ Value: ${price_low:,} - ${price_high:,}",
+        "",
+    ]))
 
-        for domain_data in domains:
-            domain_name = domain_data.get("domain_name")
-            tld = domain_data.get("tld")
 
-            logger.info(f"Processing {domain_name}.{tld}...")
+async def _integration_async():
+    """Integrated workflow: scrape -> analyze -> score"""
+    logger.info("\n" + "="*80)
+    logger.info("TEST 4: Integration Test (Scrape -> Analyze -> Score)")
+    logger.info("="*80)
+
+    # Each domain is handed off for scoring as soon as the scraper yields
+    # it, so scraping overlaps with analysis instead of finishing first
+    logger.info("Scraping, analyzing and scoring domains...\n")
 
-            # Score domain
-            score = DomainScorer.calculate_score(
-                domain_name=domain_name,
-                tld=tld,
-                age_days=domain_data.get("domain_age_days", 0),
-                backlink_count=domain_data.get("backlink_count", 0),
-            )
+    tasks = []
+    async for domain_data in LocalDomainListScraper.scrape_sample_domains(limit=3):
+        tasks.append(asyncio.create_task(_process_domain(domain_data)))
+    await asyncio.gather(*tasks)
 
-            price_low, price_high = DomainScorer.estimate_price(score["total_score"])
-            grade = DomainScorer.get_grade(score["total_score"])
 
-            logger.info(f"  ✓ Score: {score['total_score']:.1f} (Grade {grade})")
-            logger.info(f"  ✓ Value: ${price_low:,} - ${price_high:,}")
-            logger.info("")
+def test_integration():
+    """Test integrated workflow: scrape -> analyze -> score"""
+    asyncio.run(_integration_async())
+
+
+async def _run_all():
+    """Run the async tests concurrently on one event loop
+
+    They are independent and mostly wait on network I/O, so the total
+    time is that of the slowest one; their log output may interleave.
+    HTTP lookups go through one pooled client owned here, which any
+    check that needs HTTP can share
+    """
+    async with BacklinkAnalyzer.new_client(concurrency=SHARED_POOL_SIZE) as session:
+        # A failing check must not cut the others short: every check runs to
+        # completion on the warm pool, then the first failure is raised
+        results = await asyncio.gather(
+            test_backlink_analyzer(session),
+            test_expired_domains_scraper(),
+            _integration_async(),
+            return_exceptions=True,
+        )
 
-    asyncio.run(integrated_workflow())
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
 
 
 def main():
     """Run all tests"""
+    # Logging is configured here rather than at import, so importing this
+    # module (e.g. during pytest collection) leaves logging alone
+    handler = logging.StreamHandler()
+    handler.setFormatter(SecondCachedFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    logging.basicConfig(level=logging.INFO, handlers=[handler])
+
+    # The log format uses none of the thread or process fields, so don't
+    # collect them for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     logger.info("WEEK 2 COMPONENT TESTS")
     logger.info("Testing: Scraper, Analyzer, Scorer\n")
 
@@ -171,14 +268,9 @@ def main():
         # Test 1: Domain Scorer
         test_domain_scorer()
 
-        # Test 2: Backlink Analyzer (async)
-        asyncio.run(test_backlink_analyzer())
-
-        # Test 3: Expired Domains Scraper
-        asyncio.run(test_expired_domains_scraper())
-
-        # Test 4: Integration
-        test_integration()
+        # Tests 2-4: Backlink Analyzer, Expired Domains Scraper and
+        # Integration (async, run concurrently)
+        run_event_loop(_run_all())
 
         logger.info("\n" + "="*80)
         logger.info("✓ ALL TESTS COMPLETED SUCCESSFULLY")
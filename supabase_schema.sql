@@ -71,6 +71,18 @@ CREATE INDEX idx_domain_tld ON domain(tld);
 CREATE INDEX idx_portfolio_domain_id ON portfolio_item(domain_id);
 CREATE INDEX idx_domain_score_domain_id ON domain_score(domain_id);
 CREATE INDEX idx_alert_enabled ON alert(enabled);
+CREATE INDEX idx_domain_age ON domain(domain_age_days, id);
+CREATE INDEX idx_domain_backlinks ON domain(backlink_count, id);
+CREATE INDEX idx_domain_high_quality ON domain(quality_score) WHERE quality_score >= 40;
+CREATE INDEX idx_domain_quality_id ON domain(quality_score DESC, id DESC);
+CREATE INDEX idx_domain_score_domain_calc ON domain_score(domain_id, calculated_at DESC);
+
+-- On an existing database, add the newer indexes online instead:
+-- CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_domain_age ON domain(domain_age_days, id);
+-- CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_domain_backlinks ON domain(backlink_count, id);
+-- CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_domain_high_quality ON domain(quality_score) WHERE quality_score >= 40;
+-- CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_domain_quality_id ON domain(quality_score DESC, id DESC);
+-- CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_domain_score_domain_calc ON domain_score(domain_id, calculated_at DESC);
 
 -- Create updated_at trigger for domain table
 CREATE OR REPLACE FUNCTION update_domain_updated_at()